@@ -9,6 +9,12 @@ import hashlib
 from hash_calculator import calculate_sha256
 from blockchain_simulator import Block, Blockchain
 
+# Hoisted once at import: the 1000-byte input and its reference digest are
+# constants, so each test run hashes them a single time instead of
+# rebuilding the string and reference per invocation.
+_LONG_INPUT = "a" * 1000
+_LONG_INPUT_SHA256 = hashlib.sha256(_LONG_INPUT.encode()).hexdigest()
+
 
 class TestHashCalculator(unittest.TestCase):
     """Test cases for hash calculator."""
@@ -27,10 +33,8 @@ class TestHashCalculator(unittest.TestCase):
     
     def test_sha256_long_string(self):
         """Test SHA-256 hash calculation with long string."""
-        long_string = "a" * 1000
-        result = calculate_sha256(long_string)
-        expected = hashlib.sha256(long_string.encode()).hexdigest()
-        self.assertEqual(result, expected)
+        result = calculate_sha256(_LONG_INPUT)
+        self.assertEqual(result, _LONG_INPUT_SHA256)
     
     def test_sha256_output_length(self):
         """Test that SHA-256 output is always 64 characters."""
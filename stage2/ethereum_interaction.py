@@ -10,10 +10,38 @@ you think about it too hard.
 
 import os
 import json
-from typing import Dict, Optional
+import asyncio
+from functools import lru_cache
+from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from eth_account import Account
 
+# Unit conversion constants. web3's from_wei/to_wei go through
+# decimal.Decimal, which is way more precision than we need for display -
+# plain division is orders of magnitude cheaper and we cast to float anyway.
+_WEI_PER_ETH = 1_000_000_000_000_000_000
+_WEI_PER_GWEI = 1_000_000_000
+
+
+@lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """
+    Validate an address and convert it to checksum form, with caching.
+
+    to_checksum_address recomputes a Keccak-256 every single time, which
+    adds up fast when the same few addresses keep coming through. The
+    cache makes repeat lookups free.
+
+    Raises:
+        ValueError: If the address isn't a valid Ethereum address.
+    """
+    if not Web3.is_address(address):
+        raise ValueError("That doesn't look like a valid address")
+    return Web3.to_checksum_address(address)
+
 
 class EthereumClient:
     """
@@ -23,17 +51,43 @@ class EthereumClient:
     for you. Accounts, balances, transactions, all that jazz.
     """
     
-    def __init__(self, provider_url: str = "http://127.0.0.1:8545"):
+    def __init__(self, provider_url: str = "http://127.0.0.1:8545",
+                 ws_url: Optional[str] = None):
         """
         Set up the client.
-        
+
         Args:
             provider_url (str): Where the blockchain lives. Defaults to local Ganache,
                               but you can throw in an Infura or Alchemy URL if you want
+            ws_url (str): Optional WebSocket endpoint. If given, receipt
+                        waits subscribe to new blocks instead of polling.
         """
-        self.w3 = Web3(Web3.HTTPProvider(provider_url))
+        # Keep-alive session with a connection pool - without this every
+        # single RPC call pays a fresh TCP (and TLS, for remote nodes)
+        # handshake, which absolutely dwarfs the actual call time.
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.1)
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Accept-Encoding"] = "gzip"
+
+        self.w3 = Web3(Web3.HTTPProvider(
+            provider_url,
+            session=session,
+            request_kwargs={"timeout": 30}
+        ))
         self.provider_url = provider_url
-        
+        self.ws_url = ws_url
+
+        # chain_id never changes for a given node connection, so fetch it
+        # once here instead of paying an RPC round-trip every time we
+        # build a transaction.
+        self._chain_id = None
+
         # Trying to connect... fingers crossed
         if not self.w3.is_connected():
             print(f"Can't reach {provider_url}")
@@ -41,7 +95,75 @@ class EthereumClient:
             print("These things happen, no biggie.")
         else:
             print(f"✓ Connected to Ethereum node: {provider_url}")
+            self._chain_id = self.w3.eth.chain_id
+
+    def _get_chain_id(self) -> int:
+        """Cached chain_id - only hits the node if we don't have it yet."""
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
     
+    def _batch_call(self, calls):
+        """
+        Fire several read-only RPC calls as a single JSON-RPC batch.
+
+        One round-trip instead of one per call - the node answers them all
+        in a single response. Older web3.py versions don't have batching,
+        so we quietly fall back to sequential calls there.
+
+        Args:
+            calls: List of (bound_method, args_tuple) pairs.
+
+        Returns:
+            List of results, in the same order as the calls.
+        """
+        if hasattr(self.w3, "batch_requests"):
+            with self.w3.batch_requests() as batch:
+                for method, args in calls:
+                    batch.add(method(*args))
+                return batch.execute()
+        return [method(*args) for method, args in calls]
+
+    def _wait_for_receipt(self, tx_hash, timeout: int = 120):
+        """
+        Wait for a transaction receipt without hammering the node.
+
+        wait_for_transaction_receipt polls eth_getTransactionReceipt on a
+        fixed interval - that's a lot of wasted requests for something the
+        node will tell us about anyway. If a WebSocket endpoint was
+        configured, subscribe to newHeads and only check for the receipt
+        when a block actually lands. No WS endpoint (or any WS hiccup)
+        means we quietly fall back to good old polling.
+        """
+        if self.ws_url:
+            try:
+                return asyncio.run(self._wait_for_receipt_ws(tx_hash, timeout))
+            except Exception:
+                pass  # WS path didn't work out - polling still will
+        return self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+
+    async def _wait_for_receipt_ws(self, tx_hash, timeout: int):
+        """Subscribe to newHeads over WS and grab the receipt per block."""
+        from web3 import AsyncWeb3
+        from web3.providers.persistent import WebSocketProvider
+
+        async def _listen():
+            async with AsyncWeb3(WebSocketProvider(self.ws_url)) as w3_ws:
+                # Maybe it was mined before we even got here
+                try:
+                    return await w3_ws.eth.get_transaction_receipt(tx_hash)
+                except Exception:
+                    pass
+
+                await w3_ws.eth.subscribe("newHeads")
+                async for _ in w3_ws.socket.process_subscriptions():
+                    try:
+                        return await w3_ws.eth.get_transaction_receipt(tx_hash)
+                    except Exception:
+                        continue  # not in this block yet
+
+        return await asyncio.wait_for(_listen(), timeout=timeout)
+
     def get_connection_status(self) -> Dict:
         """
         Check if we're actually connected and grab some basic network info.
@@ -56,7 +178,7 @@ class EthereumClient:
                     "message": "Can't reach the provider - network issue?"
                 }
             
-            chain_id = self.w3.eth.chain_id
+            chain_id = self._get_chain_id()
             latest_block = self.w3.eth.block_number
             gas_price = self.w3.eth.gas_price
             
@@ -67,7 +189,7 @@ class EthereumClient:
                 "chain_id": chain_id,
                 "latest_block": latest_block,
                 "gas_price_wei": gas_price,
-                "gas_price_gwei": self.w3.from_wei(gas_price, "gwei")
+                "gas_price_gwei": gas_price / _WEI_PER_GWEI
             }
         except Exception as e:
             return {"connected": False, "error": str(e)}
@@ -103,23 +225,76 @@ class EthereumClient:
         Returns:
             Dict with balance in Wei, ETH, and Gwei
         """
-        if not Web3.is_address(address):
-            return {"error": "That doesn't look like a valid address"}
-        
         try:
-            address = Web3.to_checksum_address(address)
+            address = _checksum(address)
             balance_wei = self.w3.eth.get_balance(address)
-            balance_eth = self.w3.from_wei(balance_wei, "ether")
             
             return {
                 "address": address,
                 "balance_wei": balance_wei,
-                "balance_eth": float(balance_eth),
-                "balance_gwei": float(self.w3.from_wei(balance_wei, "gwei"))
+                "balance_eth": balance_wei / _WEI_PER_ETH,
+                "balance_gwei": balance_wei / _WEI_PER_GWEI
             }
         except Exception as e:
             return {"error": str(e)}
     
+    def get_balances(self, addresses: List[str]) -> Dict:
+        """
+        Check a whole bunch of balances at once, concurrently.
+
+        Doing these one-by-one means paying full network latency N times.
+        With an async provider and asyncio.gather, all N requests are in
+        flight at the same time, so the wall clock cost is roughly one
+        round-trip total. The client itself stays synchronous - this just
+        spins up an async provider for the duration of the batch.
+
+        Args:
+            addresses: List of addresses to look up.
+
+        Returns:
+            Dict mapping each address to its balance info (or an error).
+        """
+        valid = [a for a in addresses if Web3.is_address(a)]
+        results = {a: {"error": "That doesn't look like a valid address"}
+                   for a in addresses if a not in valid}
+
+        if not valid:
+            return results
+
+        async def _fetch_all():
+            from web3 import AsyncWeb3
+            async_w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.provider_url))
+            try:
+                return await asyncio.gather(
+                    *(async_w3.eth.get_balance(_checksum(a)) for a in valid),
+                    return_exceptions=True
+                )
+            finally:
+                # The batch client owns an aiohttp session; close it so
+                # repeated batches don't leak one connection per call.
+                disconnect = getattr(async_w3.provider, "disconnect", None)
+                if disconnect is not None:
+                    await disconnect()
+
+        try:
+            balances = asyncio.run(_fetch_all())
+            # Key every entry by the caller's own input string - the
+            # invalid-address entries above already are, and mixing in
+            # checksummed keys would make a lowercase input unfindable.
+            for address, balance_wei in zip(valid, balances):
+                if isinstance(balance_wei, Exception):
+                    results[address] = {"error": str(balance_wei)}
+                else:
+                    results[address] = {
+                        "address": _checksum(address),
+                        "balance_wei": balance_wei,
+                        "balance_eth": balance_wei / _WEI_PER_ETH
+                    }
+        except Exception as e:
+            return {"error": str(e)}
+
+        return results
+
     def get_account_info(self, address: str) -> Dict:
         """
         Get the full picture of an account - balance, nonce, whether it's a contract, etc.
@@ -133,19 +308,20 @@ class EthereumClient:
         Returns:
             Dict with all the account deets
         """
-        if not Web3.is_address(address):
-            return {"error": "That doesn't look like a valid address"}
-        
         try:
-            address = Web3.to_checksum_address(address)
+            address = _checksum(address)
             
-            balance_wei = self.w3.eth.get_balance(address)
-            nonce = self.w3.eth.get_transaction_count(address)
-            code = self.w3.eth.get_code(address)
+            # Three lookups, one round-trip - batching these used to be
+            # three separate calls, each paying full network latency.
+            balance_wei, nonce, code = self._batch_call([
+                (self.w3.eth.get_balance, (address,)),
+                (self.w3.eth.get_transaction_count, (address,)),
+                (self.w3.eth.get_code, (address,)),
+            ])
             
             return {
                 "address": address,
-                "balance_eth": float(self.w3.from_wei(balance_wei, "ether")),
+                "balance_eth": balance_wei / _WEI_PER_ETH,
                 "balance_wei": balance_wei,
                 "nonce": nonce,  # How many transactions this account has made
                 "is_contract": len(code) > 0,  # True if there's bytecode at this address
@@ -172,11 +348,12 @@ class EthereumClient:
             Dict with transaction receipt or an error if things went sideways
         """
         try:
-            if not Web3.is_address(from_address) or not Web3.is_address(to_address):
-                return {"error": "One of those addresses doesn't look right"}
-            
-            from_address = Web3.to_checksum_address(from_address)
-            to_address = Web3.to_checksum_address(to_address)
+            try:
+                from_address = _checksum(from_address)
+                to_address = _checksum(to_address)
+            except ValueError:
+                return {"error": "One of those addresses doesn't look right",
+                        "success": False}
             
             # Get the nonce - every transaction needs this to prevent replay attacks
             nonce = self.w3.eth.get_transaction_count(from_address)
@@ -186,17 +363,17 @@ class EthereumClient:
             tx = {
                 "nonce": nonce,
                 "to": to_address,
-                "value": self.w3.to_wei(amount_eth, "ether"),
+                "value": int(round(amount_eth * _WEI_PER_ETH)),
                 "gas": 21000,  # Standard gas for a simple value transfer
                 "gasPrice": gas_price,
-                "chainId": self.w3.eth.chain_id
+                "chainId": self._get_chain_id()
             }
             
             # Sign it with the private key
             signed_tx = self.w3.eth.account.sign_transaction(tx, private_key)
             # Send it off and wait for confirmation
             tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            receipt = self._wait_for_receipt(tx_hash, timeout=120)
             
             return {
                 "success": True,
@@ -233,9 +410,9 @@ class EthereumClient:
                 "hash": tx["hash"].hex(),
                 "from": tx["from"],
                 "to": tx["to"],
-                "value_eth": float(self.w3.from_wei(tx["value"], "ether")),
+                "value_eth": tx["value"] / _WEI_PER_ETH,
                 "gas": tx["gas"],
-                "gas_price_gwei": float(self.w3.from_wei(tx["gasPrice"], "gwei")),
+                "gas_price_gwei": tx["gasPrice"] / _WEI_PER_GWEI,
                 "nonce": tx["nonce"],
                 "block_number": receipt["blockNumber"],
                 "gas_used": receipt["gasUsed"],
@@ -261,21 +438,21 @@ class EthereumClient:
             Dict with gas estimate, current gas price, and estimated total cost
         """
         try:
-            if not Web3.is_address(from_address) or not Web3.is_address(to_address):
+            try:
+                from_address = _checksum(from_address)
+                to_address = _checksum(to_address)
+            except ValueError:
                 return {"error": "One of those addresses doesn't look right"}
             
-            from_address = Web3.to_checksum_address(from_address)
-            to_address = Web3.to_checksum_address(to_address)
-            
             gas_estimate = self.w3.eth.estimate_gas({
                 "from": from_address,
                 "to": to_address,
-                "value": self.w3.to_wei(amount_eth, "ether")
+                "value": int(round(amount_eth * _WEI_PER_ETH))
             })
             
             gas_price = self.w3.eth.gas_price
-            gas_price_gwei = float(self.w3.from_wei(gas_price, "gwei"))
-            tx_fee_eth = float(self.w3.from_wei(gas_estimate * gas_price, "ether"))
+            gas_price_gwei = gas_price / _WEI_PER_GWEI
+            tx_fee_eth = gas_estimate * gas_price / _WEI_PER_ETH
             
             return {
                 "gas_estimate": gas_estimate,
@@ -5,8 +5,80 @@ Stage 2: Mining algorithm simulation and understanding difficulty mechanics
 """
 
 import hashlib
+import multiprocessing
+import os
+import sys
 import time
-from typing import Tuple
+from typing import Iterable, Iterator, Tuple
+
+# Module-level alias keeps the constructor lookup out of the mining loop.
+_sha256 = hashlib.sha256
+
+# Optional compiled mining core. A _powcore extension (C with hardware
+# SHA-256 and its own inner loop) can be dropped in to take over the hot
+# loop entirely; it must expose
+# find_nonce(prefix: bytes, difficulty: int, start_nonce: int, stride: int)
+# -> (nonce, digest). The extension is expected to pick its SHA-256
+# kernel per architecture at load time - SHA-NI on x86-64, the ARMv8
+# cryptography extensions (sha256h/sha256h2) on AArch64 such as Apple
+# Silicon or Graviton, and a portable scalar fallback elsewhere - so this
+# module stays arch-agnostic. Without it, the pure-Python loop is used;
+# stdlib hashlib already routes to OpenSSL's arch-specific kernels.
+try:
+    import _powcore
+except ImportError:
+    # Second choice: a Cython build (pow_core.pyx binding OpenSSL's EVP
+    # API directly, with the midstate held in a C-level context) - no
+    # hardware SHA required; just moving the loop out of the interpreter
+    # removes the bytecode dispatch and per-attempt object churn. Third
+    # choice: a Numba-JIT'd core (inline SHA-256 compiled with @njit)
+    # built to the same interface. All are optional drop-ins; neither
+    # cython nor numba is a dependency of this stage.
+    try:
+        import _pow_cython as _powcore
+    except ImportError:
+        try:
+            import _pow_numba as _powcore
+        except ImportError:
+            _powcore = None
+
+# Optional GPU mining backend (e.g. a Metal or CUDA kernel hashing
+# prefix||nonce across thousands of threads, each generating its nonce
+# ASCII on-device). Same find_nonce interface as _powcore. Kernel launch
+# overhead swamps small searches, so it is only consulted at or above
+# _GPU_MIN_DIFFICULTY where the expected attempt count (~16^d) pays for
+# the dispatch.
+try:
+    import _pow_gpu
+except ImportError:
+    _pow_gpu = None
+
+_GPU_MIN_DIFFICULTY = 6
+
+
+def mining_backend(difficulty: int = 0) -> str:
+    """
+    Name of the SHA-256 backend the mining loop will use.
+
+    A compiled core picks its kernel once at load time via a runtime
+    CPU-feature probe (SHA-NI, AVX2 multi-way, SSE4, scalar, ARM SHA2)
+    and reports the choice through backend_name(); surfacing it here lets
+    runs on mixed fleets log which path they actually took.
+
+    Args:
+        difficulty (int): Difficulty of the upcoming search; decides
+            whether the GPU backend would be consulted.
+
+    Returns:
+        str: Human-readable backend name.
+    """
+    if _pow_gpu is not None and difficulty >= _GPU_MIN_DIFFICULTY:
+        name = getattr(_pow_gpu, "backend_name", None)
+        return name() if callable(name) else "gpu"
+    if _powcore is not None:
+        name = getattr(_powcore, "backend_name", None)
+        return name() if callable(name) else _powcore.__name__.lstrip("_")
+    return "hashlib (OpenSSL)"
 
 
 class ProofOfWork:
@@ -14,7 +86,11 @@ class ProofOfWork:
     Proof-of-Work mining algorithm implementation.
     Demonstrates how Bitcoin and blockchain mining operates.
     """
-    
+
+    # Specialized mining loops keyed by difficulty, shared by all
+    # instances: each difficulty level is code-generated at most once.
+    _miner_cache = {}
+
     def __init__(self, difficulty: int = 4):
         """
         Initialize PoW with a specified difficulty level.
@@ -25,7 +101,23 @@ class ProofOfWork:
         """
         self.difficulty = difficulty
         self.target = "0" * difficulty
-    
+        self._recompute_target()
+
+    def _recompute_target(self):
+        """Precompute the integer form of the difficulty target.
+
+        The leading-zero test reads just enough prefix bytes to cover the
+        required nibbles as one big-endian integer and shifts off the
+        slack nibble when difficulty is odd - a single compare with no
+        hex encoding and no odd/even branch per candidate.
+        """
+        self._check_bytes = (self.difficulty + 1) // 2
+        self._shift = 8 * self._check_bytes - 4 * self.difficulty
+
+    def _meets_target(self, digest: bytes) -> bool:
+        """Check a raw 32-byte digest against the difficulty target."""
+        return int.from_bytes(digest[:self._check_bytes], "big") >> self._shift == 0
+
     def find_nonce(self, block_data: str) -> Tuple[str, int, float]:
         """
         Mine a block by finding a nonce that produces a hash with required leading zeros.
@@ -36,28 +128,93 @@ class ProofOfWork:
         Returns:
             Tuple[str, int, float]: (resulting hash, nonce value, mining time in seconds)
         """
-        nonce = 0
         start_time = time.time()
-        
+
         print(f"\n{'='*60}")
         print(f"Mining Block (Difficulty: {self.difficulty})")
         print(f"Target: {self.target}...")
+        print(f"Backend: {mining_backend(self.difficulty)}")
         print(f"{'='*60}\n")
-        
-        while True:
-            candidate = f"{block_data}{nonce}"
-            hash_value = hashlib.sha256(candidate.encode()).hexdigest()
-            
-            if hash_value.startswith(self.target):
-                elapsed = time.time() - start_time
-                return hash_value, nonce, elapsed
-            
-            nonce += 1
-            
-            if nonce % 100000 == 0:
-                elapsed = time.time() - start_time
-                print(f"Attempts: {nonce:,} | Elapsed: {elapsed:.2f}s | Hash: {hash_value}")
+
+        if _pow_gpu is not None and self.difficulty >= _GPU_MIN_DIFFICULTY:
+            nonce, digest = _pow_gpu.find_nonce(
+                block_data.encode(), self.difficulty, 0, 1)
+            return digest.hex(), nonce, time.time() - start_time
+
+        if _powcore is not None:
+            nonce, digest = _powcore.find_nonce(
+                block_data.encode(), self.difficulty, 0, 1)
+            return digest.hex(), nonce, time.time() - start_time
+
+        # Bitcoin-style midstate reuse: the block data prefix is constant
+        # across nonces, so compress it once and clone the hasher state per
+        # attempt (OpenSSL ctx copy is a memcpy). Only the nonce tail gets
+        # hashed in the loop, regardless of how long the prefix is.
+        base = _sha256(block_data.encode())
+
+        # The inner loop is specialized per difficulty (target constants
+        # baked into a closure) and built at most once per level.
+        miner = self._miner_cache.get(self.difficulty)
+        if miner is None:
+            miner = self._miner_cache[self.difficulty] = _build_miner(self.difficulty)
+
+        nonce, digest = miner(base, sys.stdout.isatty(), start_time)
+        return digest.hex(), nonce, time.time() - start_time
     
+    def find_nonce_parallel(self, block_data: str,
+                            n_workers: int = None) -> Tuple[str, int, float]:
+        """
+        Mine a block using all CPU cores with nonce striping.
+
+        Worker i tests nonces i, i + n, i + 2n, ... so the stripes are
+        disjoint and the search is embarrassingly parallel; the first
+        worker to find a valid nonce wins and signals the rest to stop.
+
+        Args:
+            block_data (str): The block data to be mined.
+            n_workers (int): Number of worker processes (default: CPU count).
+
+        Returns:
+            Tuple[str, int, float]: (resulting hash, nonce value, mining time)
+        """
+        n_workers = n_workers or os.cpu_count() or 1
+        start_time = time.time()
+
+        print(f"\n{'='*60}")
+        print(f"Mining Block (Difficulty: {self.difficulty}, "
+              f"Workers: {n_workers})")
+        print(f"Target: {self.target}...")
+        print(f"{'='*60}\n")
+
+        # Unordered first-wins coordination: `found` is a plain shared
+        # byte the workers read without locking in their hot loop, while
+        # `publish_lock` serializes only the (rare) publication so exactly
+        # one winner writes its result even if two stripes hit at once.
+        found = multiprocessing.Value('b', 0, lock=False)
+        publish_lock = multiprocessing.Lock()
+        done = multiprocessing.Event()
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(
+                target=_mine_worker,
+                args=(block_data, self.difficulty, i, n_workers,
+                      found, publish_lock, done, results)
+            )
+            for i in range(n_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        done.wait()
+        nonce, digest = results.get()
+
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+        return digest.hex(), nonce, time.time() - start_time
+
     def verify_proof(self, block_data: str, nonce: int, block_hash: str) -> bool:
         """
         Verify that a proof-of-work is valid.
@@ -71,10 +228,19 @@ class ProofOfWork:
             bool: True if proof is valid, False otherwise.
         """
         candidate = f"{block_data}{nonce}"
-        calculated_hash = hashlib.sha256(candidate.encode()).hexdigest()
-        
-        return (calculated_hash == block_hash and 
-                calculated_hash.startswith(self.target))
+        calculated = _sha256(candidate.encode()).digest()
+
+        # Accept the stored hash as hex or raw bytes; the comparison and
+        # the target test both happen at the byte level.
+        if isinstance(block_hash, bytes):
+            expected = block_hash
+        else:
+            try:
+                expected = bytes.fromhex(block_hash)
+            except ValueError:
+                return False
+
+        return calculated == expected and self._meets_target(calculated)
     
     def adjust_difficulty(self, new_difficulty: int):
         """
@@ -85,6 +251,7 @@ class ProofOfWork:
         """
         self.difficulty = new_difficulty
         self.target = "0" * new_difficulty
+        self._recompute_target()
         print(f"Difficulty adjusted to: {new_difficulty}")
     
     def get_difficulty_info(self) -> dict:
@@ -97,6 +264,151 @@ class ProofOfWork:
         }
 
 
+def _inc_ascii(counter):
+    """Increment a decimal-ASCII counter in place with carry propagation.
+
+    Almost every call touches only the last digit; the bytearray is
+    mutated rather than rebuilt, so the steady state allocates nothing.
+    """
+    i = len(counter) - 1
+    while i >= 0:
+        if counter[i] == 0x39:  # '9'
+            counter[i] = 0x30   # '0'
+            i -= 1
+        else:
+            counter[i] += 1
+            return
+    counter.insert(0, 0x31)     # '1'
+
+
+def find_nonce_fast(prefix: bytes, zero_bits: int) -> Tuple[bytes, int]:
+    """
+    Find a nonce whose digest has `zero_bits` leading zero bits.
+
+    Bare-metal variant of the class API for benchmarks and tests: no
+    banner, no progress I/O, and bit-granular difficulty so suites can
+    dial in sub-nibble work sizes. Uses the same midstate reuse,
+    incremental ASCII counter, and branchless integer target test as the
+    specialized miners.
+
+    Args:
+        prefix (bytes): Constant block-data prefix.
+        zero_bits (int): Required number of leading zero bits.
+
+    Returns:
+        Tuple[bytes, int]: (raw digest, nonce)
+    """
+    check_bytes = (zero_bits + 7) // 8
+    shift = 8 * check_bytes - zero_bits
+    from_bytes = int.from_bytes
+    inc = _inc_ascii
+
+    base = _sha256(prefix)
+    copy = base.copy
+    counter = bytearray(b"0")
+    nonce = 0
+
+    while True:
+        h = copy()
+        h.update(counter)
+        digest = h.digest()
+        if from_bytes(digest[:check_bytes], "big") >> shift == 0:
+            return digest, nonce
+        inc(counter)
+        nonce += 1
+
+
+def _build_miner(difficulty):
+    """
+    Build a mining loop specialized for one difficulty level.
+
+    Runtime partial evaluation: the target-test constants (prefix width
+    and slack shift) are baked into the closure's cells, so the hot loop
+    never touches `self` or re-derives the target. The nonce's decimal
+    ASCII form is kept as an incrementally-updated bytearray instead of
+    being reformatted from the integer each attempt.
+
+    Returns:
+        callable: miner(base_hasher, show_progress, start_time)
+            -> (nonce, digest)
+    """
+    check_bytes = (difficulty + 1) // 2
+    shift = 8 * check_bytes - 4 * difficulty
+    from_bytes = int.from_bytes
+    inc = _inc_ascii
+
+    def miner(base, show_progress, start_time):
+        nonce = 0
+        copy = base.copy
+        counter = bytearray(b"0")
+        ticks = 50000  # iterations between reports; 2 nonces per iteration
+
+        while True:
+            h = copy()
+            h.update(counter)
+            digest0 = h.digest()
+
+            inc(counter)
+            h = copy()
+            h.update(counter)
+            digest1 = h.digest()
+
+            if from_bytes(digest0[:check_bytes], "big") >> shift == 0:
+                return nonce, digest0
+            if from_bytes(digest1[:check_bytes], "big") >> shift == 0:
+                return nonce + 1, digest1
+
+            inc(counter)
+            nonce += 2
+
+            ticks -= 1
+            if not ticks:
+                ticks = 50000
+                if show_progress:
+                    elapsed = time.time() - start_time
+                    print(f"Attempts: {nonce:,} | Elapsed: {elapsed:.2f}s | Hash: {digest1.hex()}")
+
+    return miner
+
+
+def _mine_worker(block_data, difficulty, worker_id, stride,
+                 found, publish_lock, done, results):
+    """
+    Mining worker: tests the nonce stripe worker_id, worker_id + stride, ...
+
+    Each worker owns a disjoint stripe so no two processes ever test the
+    same nonce, and results are inherently unordered - whichever stripe
+    hits first wins, never held back by slower neighbours. The `found`
+    flag is an unlocked shared byte: reading it every 4096 attempts costs
+    nothing in the hot loop, and publication of the single winning result
+    is serialized under `publish_lock` instead.
+    """
+    pow = ProofOfWork(difficulty=difficulty)
+    base = _sha256(block_data.encode())
+    nonce = worker_id
+    ticks = 4096
+
+    while True:
+        h = base.copy()
+        h.update(b"%d" % nonce)
+        digest = h.digest()
+
+        if pow._meets_target(digest):
+            with publish_lock:
+                if not found.value:
+                    found.value = 1
+                    results.put((nonce, digest))
+                    done.set()
+            return
+
+        nonce += stride
+        ticks -= 1
+        if not ticks:
+            ticks = 4096
+            if found.value:
+                return
+
+
 class MinedBlock:
     """Represents a block that has been mined using Proof-of-Work."""
     
@@ -130,28 +442,47 @@ Block #{self.block_number}
 """
 
 
+def mine_stream(data: str, difficulties: Iterable[int]) -> Iterator[Tuple[int, str, int, float]]:
+    """
+    Lazily mine the same data at a sequence of difficulty levels.
+
+    One ProofOfWork instance is reused across the whole sweep via
+    adjust_difficulty, so per-run setup (backend selection, specialized
+    miner construction) is paid once and results stream out as each
+    level finishes rather than after the full sweep.
+
+    Args:
+        data (str): The block data to mine at every level.
+        difficulties (Iterable[int]): Difficulty levels, in order.
+
+    Yields:
+        Tuple[int, str, int, float]: (difficulty, hash, nonce, mining time)
+    """
+    pow = None
+    for difficulty in difficulties:
+        if pow is None:
+            pow = ProofOfWork(difficulty=difficulty)
+        else:
+            pow.adjust_difficulty(difficulty)
+        hash_result, nonce, mining_time = pow.find_nonce(data)
+        yield difficulty, hash_result, nonce, mining_time
+
+
 def compare_difficulties():
     """Demonstrate the impact of different difficulty levels on mining."""
     print("\n" + "="*60)
     print("DIFFICULTY LEVEL COMPARISON")
     print("="*60 + "\n")
-    
+
     test_data = "Sample Transaction Block"
-    
-    for difficulty in range(2, 6):
+
+    for difficulty, hash_result, nonce, mining_time in mine_stream(test_data, range(2, 6)):
         print(f"\n{'─'*60}")
         print(f"Difficulty: {difficulty}")
         print(f"{'─'*60}")
-        
-        pow = ProofOfWork(difficulty=difficulty)
-        info = pow.get_difficulty_info()
-        
-        print(f"Target: {info['target']}...")
-        print(f"Expected attempts: {info['approx_attempts']:,}")
-        
-        start = time.time()
-        hash_result, nonce, mining_time = pow.find_nonce(test_data)
-        
+        print(f"Target: {'0' * difficulty}...")
+        print(f"Expected attempts: {16 ** difficulty:,}")
+
         print(f"\n✓ Block mined!")
         print(f"  Hash: {hash_result}")
         print(f"  Nonce: {nonce:,}")
@@ -4,24 +4,97 @@ Smart Contract Deployment Script
 Stage 2: Deploy and interact with Solidity contracts
 """
 
+import hashlib
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
+from web3.providers.rpc import HTTPProvider
 from eth_account import Account
 
+# orjson parses/serializes JSON several times faster than the stdlib
+# module; worthwhile on large eth_call and receipt responses. Optional -
+# the provider falls back to web3's default codec without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SOLC_VERSION = "0.8.19"
+
+# Version last handed to set_solc_version; solcx re-resolves the binary on
+# every call, so we only switch when the wanted version actually changes.
+_active_solc_version = None
+
+# On-disk home for compiled artifacts, shared across runs.
+_COMPILE_CACHE_DIR = os.path.expanduser("~/.cache/learn-blockchain")
+
+
+@lru_cache(maxsize=1024)
+def _checksum(address: str) -> str:
+    """Memoized EIP-55 checksumming.
+
+    to_checksum_address runs a Keccak-256 per call, and deployment flows
+    keep re-checksumming the same handful of addresses.
+    """
+    return Web3.to_checksum_address(address)
+
+
+class _OrjsonHTTPProvider(HTTPProvider):
+    """HTTPProvider that does its JSON wire coding through orjson.
+
+    Only the encode/decode of the RPC envelope changes; everything above
+    (result formatting, hex decoding) is untouched.
+    """
+
+    def encode_rpc_request(self, method, params):
+        return orjson.dumps({
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        })
+
+    def decode_rpc_response(self, raw_response):
+        return orjson.loads(raw_response)
+
 
 class ContractDeployer:
     """Helper class to deploy and interact with smart contracts."""
-    
+
     def __init__(self, provider_url: str = "http://127.0.0.1:8545"):
         """
         Initialize deployer.
-        
+
         Args:
             provider_url (str): RPC provider URL.
         """
-        self.w3 = Web3(Web3.HTTPProvider(provider_url))
+        # Compiled {abi, bytecode} keyed by source hash, so repeated
+        # deployments never re-run the Solidity compiler.
+        self._compile_cache: Dict[str, Dict] = {}
+
+        # One pooled session for the life of the deployer: keep-alive
+        # connections skip the TCP/TLS handshake on every RPC call, and
+        # transient provider hiccups are retried with a short backoff.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.1),
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        provider_cls = _OrjsonHTTPProvider if orjson is not None else HTTPProvider
+        self.w3 = Web3(provider_cls(
+            provider_url,
+            session=self._session,
+            request_kwargs={"timeout": 30},
+        ))
         
         if not self.w3.is_connected():
             print(f"Warning: Cannot connect to {provider_url}")
@@ -38,32 +111,67 @@ class ContractDeployer:
         Returns:
             Dict: Compiled contract with ABI and bytecode.
         """
+        global _active_solc_version
+
         try:
             from solcx import compile_source, set_solc_version
-            
+
             # Read contract file
             with open(contract_path, 'r') as f:
                 source_code = f.read()
-            
-            # Set solc version
-            set_solc_version("0.8.19")
-            
+
+            # Compilation is pure in the source text, so the cache key is
+            # its hash: an unchanged contract is compiled at most once per
+            # machine, not once per deploy.
+            key = hashlib.sha256(source_code.encode()).hexdigest()
+
+            cached = self._compile_cache.get(key)
+            if cached is not None:
+                return cached
+
+            cache_path = os.path.join(
+                _COMPILE_CACHE_DIR, f"solc_{_SOLC_VERSION}_{key}.json")
+            if os.path.exists(cache_path):
+                with open(cache_path, 'r') as f:
+                    cached = json.load(f)
+                self._compile_cache[key] = cached
+                return cached
+
+            # Set solc version (skipped when it is already active)
+            if _active_solc_version != _SOLC_VERSION:
+                set_solc_version(_SOLC_VERSION)
+                _active_solc_version = _SOLC_VERSION
+
             # Compile
             compiled = compile_source(
                 source_code,
-                solc_version="0.8.19",
+                solc_version=_SOLC_VERSION,
                 output_values=["abi", "bin"]
             )
-            
+
             # Get first contract
             contract_key = list(compiled.keys())[0]
             contract_data = compiled[contract_key]
-            
-            return {
+
+            result = {
                 "abi": contract_data['abi'],
                 "bytecode": contract_data['bin']
             }
-            
+
+            # Populate both caches; the disk write goes through a temp
+            # file so a crash mid-write never leaves a torn artifact.
+            self._compile_cache[key] = result
+            try:
+                os.makedirs(_COMPILE_CACHE_DIR, exist_ok=True)
+                tmp_path = cache_path + ".tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(result, f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # cache is best-effort; compilation still succeeded
+
+            return result
+
         except ImportError:
             print("Error: solcx not installed!")
             print("Install with: pip install py-solc-x")
@@ -119,6 +227,31 @@ class ContractDeployer:
         """Get test bytecode."""
         return "0x6080604052"
     
+    def _get_nonce_and_gas_price(self, deployer_address: str) -> tuple:
+        """
+        Fetch the deployer nonce and current gas price in one round-trip.
+
+        Both values are needed before signing, so they are packed into a
+        single JSON-RPC batch request instead of two sequential HTTP
+        round-trips. Providers without batch support fall back to the
+        sequential calls.
+
+        Args:
+            deployer_address (str): Checksummed deployer address.
+
+        Returns:
+            tuple: (nonce, gas_price)
+        """
+        try:
+            with self.w3.batch_requests() as batch:
+                batch.add(self.w3.eth.get_transaction_count(deployer_address))
+                batch.add(self.w3.eth.gas_price)
+                nonce, gas_price = batch.execute()
+            return nonce, gas_price
+        except Exception:
+            return (self.w3.eth.get_transaction_count(deployer_address),
+                    self.w3.eth.gas_price)
+
     def deploy_contract(self, contract_name: str, constructor_args: list,
                        deployer_address: str, private_key: str) -> Dict:
         """
@@ -144,16 +277,16 @@ class ContractDeployer:
             
             contract = self.w3.eth.contract(abi=abi, bytecode=bytecode)
             
-            deployer_address = Web3.to_checksum_address(deployer_address)
-            nonce = self.w3.eth.get_transaction_count(deployer_address)
-            
+            deployer_address = _checksum(deployer_address)
+            nonce, gas_price = self._get_nonce_and_gas_price(deployer_address)
+
             constructor = contract.constructor(*constructor_args)
-            
+
             tx = constructor.build_transaction({
                 "from": deployer_address,
                 "nonce": nonce,
                 "gas": 1000000,
-                "gasPrice": self.w3.eth.gas_price
+                "gasPrice": gas_price
             })
             
             signed_tx = self.w3.eth.account.sign_transaction(tx, private_key)
@@ -192,7 +325,7 @@ class ContractDeployer:
             Dict: Contract instance and available methods.
         """
         try:
-            contract_address = Web3.to_checksum_address(contract_address)
+            contract_address = _checksum(contract_address)
             contract = self.w3.eth.contract(address=contract_address, abi=abi)
             
             return {
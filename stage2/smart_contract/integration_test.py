@@ -4,76 +4,164 @@ Integration Tests for Smart Contract Deploy and Interact
 Tests the complete workflow: Deploy -> Read -> Update -> Verify
 """
 
+import functools
+import inspect
 import unittest
 import json
 import os
 import tempfile
 from unittest.mock import Mock, patch, MagicMock
+from hexbytes import HexBytes
 from web3 import Web3
 from deploy import ContractDeployer
 from interact import ContractInteractor
 
+# Mock ABI for the SimpleGreeter contract, hoisted to module scope so the
+# dict/list structure is built once per run instead of once per test.
+# Treated as immutable - no test mutates it. Sharing one object also lets
+# the interactor's ABI cache short-circuit on identity.
+# orjson mirrors the optional artifact codec used by interact.py; the
+# persistence test exercises whichever implementation the demo would use.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_artifact(path, info):
+    """Write a deployment artifact with the fastest available codec."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(info, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(info, f, indent=2)
+
+
+def _load_artifact(path):
+    """Read a deployment artifact with the fastest available codec."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@functools.cache
+def _param_names(fn):
+    """Parameter names of a callable, memoized.
+
+    inspect.signature builds Parameter objects on every call - hundreds
+    of microseconds - so repeated introspection of the same function is
+    answered from the cache.
+    """
+    return tuple(inspect.signature(fn).parameters)
+
+
+_MOCK_ABI = [
+    {
+        "inputs": [{"internalType": "string", "name": "initialGreeting", "type": "string"}],
+        "stateMutability": "nonpayable",
+        "type": "constructor"
+    },
+    {
+        "inputs": [{"internalType": "string", "name": "newGreeting", "type": "string"}],
+        "name": "setGreeting",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "getGreeting",
+        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "greeting",
+        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "greetingCount",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
 
 class IntegrationTestDeployAndInteract(unittest.TestCase):
     """Integration tests for deploy.py and interact.py workflow."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared, read-only test fixtures once per class.
+
+        Building a ContractDeployer/ContractInteractor constructs a full
+        Web3 provider stack (requests session, middleware chain); doing
+        that per test dominated the suite's wall time. The tests only
+        read these fixtures, so one instance each is safe to share.
+        """
+        cls.mock_provider_url = "http://127.0.0.1:8545"
+        cls.deployer = ContractDeployer(provider_url=cls.mock_provider_url)
+        cls.interactor = ContractInteractor(provider_url=cls.mock_provider_url)
+
     def setUp(self):
-        """Set up test fixtures."""
-        # Create deployer and interactor with mocked provider
-        self.mock_provider_url = "http://127.0.0.1:8545"
-        self.deployer = ContractDeployer(provider_url=self.mock_provider_url)
-        self.interactor = ContractInteractor(provider_url=self.mock_provider_url)
-        
-        # Create temporary directory for test artifacts
+        """Set up per-test mutable state."""
+        # Create temporary directory for test artifacts. Tests address it
+        # by absolute path; the CWD is left alone, since os.chdir is
+        # process-global and would serialize parallel test runners.
         self.test_dir = tempfile.mkdtemp()
-        self.original_cwd = os.getcwd()
-        os.chdir(self.test_dir)
-    
+
+        # One shared patch of interact.Web3 with the default mock wiring;
+        # tests only override the deltas they need on self.mock_w3
+        # instead of re-applying a decorator and rebuilding the topology.
+        patcher = patch('interact.Web3')
+        self.mock_interact_web3 = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_w3 = self._build_mock_w3()
+        self._install_mock_w3(self.mock_interact_web3, self.mock_w3)
+
     def tearDown(self):
         """Clean up after tests."""
-        os.chdir(self.original_cwd)
         # Clean up temporary files
         if os.path.exists(self.test_dir):
             import shutil
             shutil.rmtree(self.test_dir)
     
-    def get_mock_abi(self):
+    @staticmethod
+    def get_mock_abi():
         """Get mock ABI for SimpleGreeter contract."""
-        return [
-            {
-                "inputs": [{"internalType": "string", "name": "initialGreeting", "type": "string"}],
-                "stateMutability": "nonpayable",
-                "type": "constructor"
-            },
-            {
-                "inputs": [{"internalType": "string", "name": "newGreeting", "type": "string"}],
-                "name": "setGreeting",
-                "outputs": [],
-                "stateMutability": "nonpayable",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "getGreeting",
-                "outputs": [{"internalType": "string", "name": "", "type": "string"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "greeting",
-                "outputs": [{"internalType": "string", "name": "", "type": "string"}],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "greetingCount",
-                "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
+        return _MOCK_ABI
+
+    @staticmethod
+    def _build_mock_w3():
+        """Build a plain-Mock Web3 double with the canned RPC responses.
+
+        Mock skips MagicMock's magic-method autospeccing, which is the
+        bulk of mock construction cost, and one builder replaces the
+        copy-pasted setup each test used to carry. No spec= is attached:
+        web3 wires its eth module on at runtime, so the class dict has
+        nothing useful to spec against.
+        """
+        mock_w3 = Mock()
+        mock_w3.is_connected.return_value = True
+        mock_w3.eth.get_transaction_count.return_value = 0
+        mock_w3.eth.gas_price = 1000000000
+        mock_w3.eth.send_raw_transaction.return_value = b'\x00' * 32
+        mock_w3.eth.account.sign_transaction.return_value = Mock(
+            rawTransaction=b'test', raw_transaction=b'test')
+        return mock_w3
+
+    @classmethod
+    def _install_mock_w3(cls, mock_web3_class, mock_w3):
+        """Wire a mock Web3 instance into a patched Web3 class."""
+        mock_web3_class.HTTPProvider.return_value = Mock()
+        mock_web3_class.return_value = mock_w3
+        mock_web3_class.to_checksum_address = Web3.to_checksum_address
     
     def test_compile_contract_succeeds(self):
         """Test that contract compilation returns valid ABI and bytecode."""
@@ -103,15 +191,8 @@ class IntegrationTestDeployAndInteract(unittest.TestCase):
     def test_deployment_workflow_with_mock(self, mock_web3_class):
         """Test complete deployment workflow with mocked Web3."""
         # Setup mocks
-        mock_w3 = MagicMock()
-        mock_web3_class.HTTPProvider.return_value = MagicMock()
-        mock_web3_class.return_value = mock_w3
-        mock_web3_class.to_checksum_address = Web3.to_checksum_address
-        
-        mock_w3.is_connected.return_value = True
-        mock_w3.eth.get_transaction_count.return_value = 0
-        mock_w3.eth.gas_price = 1000000000
-        mock_w3.eth.send_raw_transaction.return_value = b'\x00' * 32
+        mock_w3 = self._build_mock_w3()
+        self._install_mock_w3(mock_web3_class, mock_w3)
         mock_w3.eth.wait_for_transaction_receipt.return_value = {
             "contractAddress": "0x" + "1" * 40,
             "blockNumber": 1,
@@ -120,8 +201,8 @@ class IntegrationTestDeployAndInteract(unittest.TestCase):
         }
         
         # Create mock contract
-        mock_contract = MagicMock()
-        mock_constructor = MagicMock()
+        mock_contract = Mock()
+        mock_constructor = Mock()
         mock_constructor.build_transaction.return_value = {
             "from": "0x" + "1" * 40,
             "nonce": 0,
@@ -130,8 +211,6 @@ class IntegrationTestDeployAndInteract(unittest.TestCase):
         }
         mock_contract.constructor.return_value = mock_constructor
         mock_w3.eth.contract.return_value = mock_contract
-        mock_w3.eth.account.sign_transaction = Mock()
-        mock_w3.eth.account.sign_transaction.return_value = MagicMock(rawTransaction=b'test')
         
         # Create deployer with mocked Web3
         deployer = ContractDeployer(provider_url=self.mock_provider_url)
@@ -165,19 +244,13 @@ class IntegrationTestDeployAndInteract(unittest.TestCase):
         self.assertIsNotNone(self.interactor.send_transaction)
         self.assertIsNotNone(self.interactor.get_events)
     
-    @patch('interact.Web3')
-    def test_read_call_workflow(self, mock_web3_class):
+    def test_read_call_workflow(self):
         """Test read-only function call workflow."""
         # Setup mocks
-        mock_w3 = MagicMock()
-        mock_web3_class.HTTPProvider.return_value = MagicMock()
-        mock_web3_class.return_value = mock_w3
-        mock_web3_class.to_checksum_address = Web3.to_checksum_address
+        mock_w3 = self.mock_w3
         
-        mock_w3.is_connected.return_value = True
-        
-        mock_contract = MagicMock()
-        mock_function = MagicMock()
+        mock_contract = Mock()
+        mock_function = Mock()
         mock_function.call.return_value = "Hello World"
         mock_contract.functions.getGreeting = Mock(return_value=mock_function)
         mock_w3.eth.contract.return_value = mock_contract
@@ -199,22 +272,14 @@ class IntegrationTestDeployAndInteract(unittest.TestCase):
         self.assertEqual(result["result"], "Hello World")
         self.assertEqual(result["function"], "getGreeting")
     
-    @patch('interact.Web3')
-    def test_write_transaction_workflow(self, mock_web3_class):
+    def test_write_transaction_workflow(self):
         """Test state-changing transaction workflow."""
         # Setup mocks
-        mock_w3 = MagicMock()
-        mock_web3_class.HTTPProvider.return_value = MagicMock()
-        mock_web3_class.return_value = mock_w3
-        mock_web3_class.to_checksum_address = Web3.to_checksum_address
+        mock_w3 = self.mock_w3
         
-        mock_w3.is_connected.return_value = True
-        mock_w3.eth.get_transaction_count.return_value = 0
-        mock_w3.eth.gas_price = 1000000000
-        
-        mock_contract = MagicMock()
-        mock_function = MagicMock()
-        mock_tx_obj = MagicMock()
+        mock_contract = Mock()
+        mock_function = Mock()
+        mock_tx_obj = Mock()
         mock_tx_obj.build_transaction.return_value = {
             "from": "0x" + "1" * 40,
             "nonce": 0,
@@ -227,9 +292,6 @@ class IntegrationTestDeployAndInteract(unittest.TestCase):
         mock_w3.eth.contract.return_value = mock_contract
         
         # Mock transaction sending
-        mock_w3.eth.account.sign_transaction = Mock()
-        mock_w3.eth.account.sign_transaction.return_value = MagicMock(rawTransaction=b'test')
-        mock_w3.eth.send_raw_transaction.return_value = b'\x00' * 32
         mock_w3.eth.wait_for_transaction_receipt.return_value = {
             "blockNumber": 1,
             "gasUsed": 50000,
@@ -260,6 +322,75 @@ class IntegrationTestDeployAndInteract(unittest.TestCase):
         self.assertIn("gas_used", result)
         self.assertEqual(result["status"], "Success")
     
+    def _mock_set_greeting_contract(self):
+        """Wire a setGreeting contract mock into self.mock_w3."""
+        mock_contract = Mock()
+        mock_function = Mock()
+        mock_tx_obj = Mock()
+        mock_tx_obj.build_transaction.return_value = {
+            "from": "0x" + "1" * 40,
+            "nonce": 0,
+            "value": 0,
+            "gas": 1000000,
+            "gasPrice": 1000000000
+        }
+        mock_function.return_value = mock_tx_obj
+        mock_contract.functions.setGreeting = Mock(return_value=mock_function)
+        self.mock_w3.eth.contract.return_value = mock_contract
+
+    def _send_sync_transaction(self, raw_receipt):
+        """Run send_transaction(sync_submit=True) against a canned raw
+        eth_sendRawTransactionSync response."""
+        self._mock_set_greeting_contract()
+        self.mock_w3.manager.request_blocking.return_value = raw_receipt
+
+        interactor = ContractInteractor(provider_url=self.mock_provider_url)
+        return interactor.send_transaction(
+            "0x" + "1" * 40,
+            self.get_mock_abi(),
+            "setGreeting",
+            "0x" + "2" * 40,
+            "0x" + "3" * 64,
+            ["New Greeting"],
+            sync_submit=True
+        )
+
+    def test_sync_submit_transaction_workflow(self):
+        """Test sync_submit normalizes the raw EIP-7966 receipt.
+
+        The raw response carries un-formatted hex strings; the result
+        must still match the polling path's shapes, and neither
+        send_raw_transaction nor the receipt poll should run.
+        """
+        raw_hash = "0x" + "ab" * 32
+        result = self._send_sync_transaction({
+            "transactionHash": raw_hash,
+            "blockNumber": "0x10",
+            "gasUsed": "0xc350",
+            "status": "0x1"
+        })
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["tx_hash"], HexBytes(raw_hash).hex())
+        self.assertEqual(result["block_number"], 16)
+        self.assertEqual(result["gas_used"], 50000)
+        self.assertEqual(result["status"], "Success")
+        self.mock_w3.eth.send_raw_transaction.assert_not_called()
+        self.mock_w3.eth.wait_for_transaction_receipt.assert_not_called()
+
+    def test_sync_submit_reports_reverted_transaction(self):
+        """Test sync_submit maps raw status '0x0' to Failed, not the
+        truthy-string Success it used to produce."""
+        result = self._send_sync_transaction({
+            "transactionHash": "0x" + "cd" * 32,
+            "blockNumber": "0x11",
+            "gasUsed": "0x5208",
+            "status": "0x0"
+        })
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["status"], "Failed")
+
     def test_complete_workflow_simulation(self):
         """Test complete workflow: compile -> prepare deployment -> prepare call -> prepare transaction."""
         # Step 1: Mock compile contract
@@ -295,34 +426,26 @@ class IntegrationTestDeployAndInteract(unittest.TestCase):
         
         # Save artifact
         artifact_path = os.path.join(self.test_dir, "SimpleGreeter.json")
-        with open(artifact_path, "w") as f:
-            json.dump(deployment_info, f, indent=2)
-        
+        _dump_artifact(artifact_path, deployment_info)
+
         # Verify file exists
         self.assertTrue(os.path.exists(artifact_path))
-        
+
         # Load artifact
-        with open(artifact_path, "r") as f:
-            loaded_info = json.load(f)
+        loaded_info = _load_artifact(artifact_path)
         
         # Verify content matches
         self.assertEqual(loaded_info["name"], deployment_info["name"])
         self.assertEqual(loaded_info["address"], deployment_info["address"])
         self.assertEqual(loaded_info["abi"], deployment_info["abi"])
     
-    @patch('interact.Web3')
-    def test_event_retrieval_workflow(self, mock_web3_class):
+    def test_event_retrieval_workflow(self):
         """Test event retrieval workflow."""
         # Setup mocks
-        mock_w3 = MagicMock()
-        mock_web3_class.HTTPProvider.return_value = MagicMock()
-        mock_web3_class.return_value = mock_w3
-        mock_web3_class.to_checksum_address = Web3.to_checksum_address
+        mock_w3 = self.mock_w3
         
-        mock_w3.is_connected.return_value = True
-        
-        mock_contract = MagicMock()
-        mock_event = MagicMock()
+        mock_contract = Mock()
+        mock_event = Mock()
         mock_event.get_logs.return_value = [
             {"args": {"updater": "0x" + "1" * 40, "newGreeting": "Hello"}},
             {"args": {"updater": "0x" + "2" * 40, "newGreeting": "Hi"}}
@@ -366,13 +489,9 @@ class WorkflowSequenceTest(unittest.TestCase):
         """Verify that deployment must happen before interaction."""
         # This is a logical test - interact needs contract address from deploy
         # We verify that interact.call_function requires contract_address parameter
-        interactor = ContractInteractor()
-        
         # Verify method signature requires contract_address
-        import inspect
-        sig = inspect.signature(interactor.call_function)
-        params = list(sig.parameters.keys())
-        
+        params = _param_names(ContractInteractor.call_function)
+
         self.assertIn("contract_address", params)
         self.assertIn("abi", params)
         self.assertIn("function_name", params)
@@ -4,29 +4,235 @@ Smart Contract Interaction Script
 Stage 2: Call contract functions and read state
 """
 
+import asyncio
+import hashlib
 import json
+import threading
+from functools import lru_cache
 from typing import Dict
-from web3 import Web3
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from hexbytes import HexBytes
+# Top-level export is stable across web3 v6/v7; the old
+# web3.providers.async_rpc module path is gone in v7.
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
 from eth_account import Account
+from eth_utils import function_abi_to_4byte_selector
+from web3.exceptions import Web3Exception
+
+# Failure classes the public API converts into structured error dicts,
+# pre-bound as one tuple. Catching these instead of bare Exception keeps
+# KeyboardInterrupt/SystemExit propagating, and callers get a stable
+# error_code (the exception class name) to branch on instead of parsing
+# message strings. StopIteration covers unknown-function ABI lookups.
+_RPC_ERRORS = (Web3Exception, ValueError, TypeError, KeyError, StopIteration)
+
+# orjson (C implementation) loads deployment artifacts several times
+# faster than stdlib json; optional, with a stdlib fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One pooled session shared by every interactor in the process (module
+# singleton so test suites that build many instances still reuse warm
+# connections): keep-alive skips the TCP/TLS handshake per RPC call.
+_shared_session = None
+
+
+def _get_session() -> requests.Session:
+    """Return the process-wide pooled session, building it on first use."""
+    global _shared_session
+    if _shared_session is None:
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.1),
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers['Content-Type'] = 'application/json'
+        _shared_session = session
+    return _shared_session
+
+
+@lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """Memoized EIP-55 checksumming.
+
+    to_checksum_address runs a Keccak-256 per call; interaction loops
+    hand the same handful of addresses back in over and over, so the
+    steady state becomes a dict probe.
+    """
+    return Web3.to_checksum_address(address)
+
+# Multicall3 is deployed at the same address on virtually every chain
+# (and on Hardhat/Anvil forks); aggregate3 trampolines N view calls
+# through one eth_call, which beats even node-side JSON-RPC batching
+# since the node executes everything in a single EVM context.
+_MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+_MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
 
 
 class ContractInteractor:
     """Helper class to interact with deployed smart contracts."""
     
-    def __init__(self, provider_url: str = "http://127.0.0.1:8545"):
+    def __init__(self, provider_url: str = "http://127.0.0.1:8545",
+                 provider_urls: list = None):
         """
         Initialize the contract interactor.
-        
+
         Args:
             provider_url: RPC provider URL endpoint.
+            provider_urls: Optional list of endpoints. Reads and receipt
+                waits go to the first one; raw transactions are broadcast
+                to all of them in parallel for faster propagation.
         """
-        self.w3 = Web3(Web3.HTTPProvider(provider_url))
-        
+        self._provider_urls = list(provider_urls) if provider_urls else [provider_url]
+        provider_url = self._provider_urls[0]
+
+        self.w3 = Web3(Web3.HTTPProvider(
+            provider_url,
+            session=_get_session(),
+            request_kwargs={"timeout": 30},
+        ))
+
+        # Contract objects keyed by (address, abi digest): building one
+        # walks the whole ABI and materializes function proxies, which is
+        # pure waste when the same contract is hit in a loop.
+        self._contract_cache: Dict[tuple, object] = {}
+        self._abi_keys: Dict[int, tuple] = {}
+        self._function_cache: Dict[tuple, object] = {}
+        self._calldata_cache: Dict[tuple, tuple] = {}
+
+        # Locally tracked per-sender nonces: fetched from the node once,
+        # then incremented after each broadcast so back-to-back sends
+        # skip the eth_getTransactionCount round-trip and can have
+        # several transactions in flight per block.
+        self._nonces: Dict[str, int] = {}
+        self._nonce_lock = threading.Lock()
+
         if not self.w3.is_connected():
             print(f"Warning: Cannot connect to {provider_url}")
         else:
             print(f"Connected to {provider_url}")
     
+    def _abi_key(self, abi: list) -> bytes:
+        """
+        Stable digest of an ABI, memoized by object identity.
+
+        The id() shortcut makes the steady state (same ABI list passed
+        repeatedly) a dict probe; the canonical-JSON hash only runs the
+        first time a given list object is seen. The ABI is kept in the
+        memo so its id cannot be recycled while the entry lives.
+        """
+        cached = self._abi_keys.get(id(abi))
+        if cached is not None and cached[0] is abi:
+            return cached[1]
+        key = hashlib.blake2b(
+            json.dumps(abi, sort_keys=True).encode(), digest_size=16).digest()
+        self._abi_keys[id(abi)] = (abi, key)
+        return key
+
+    def _get_contract(self, contract_address: str, abi: list):
+        """
+        Fetch or build the Contract object for (address, abi).
+
+        Args:
+            contract_address: Checksummed contract address.
+            abi: Contract ABI.
+
+        Returns:
+            The memoized web3 Contract instance.
+        """
+        key = (contract_address, self._abi_key(abi))
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            contract = self.w3.eth.contract(address=contract_address, abi=abi)
+            self._contract_cache[key] = contract
+        return contract
+
+    def _get_function(self, contract, function_name: str):
+        """Fetch or build the function proxy for a cached contract."""
+        key = (id(contract), function_name)
+        function = self._function_cache.get(key)
+        if function is None:
+            function = getattr(contract.functions, function_name)
+            self._function_cache[key] = function
+        return function
+
+    def _fn_codec(self, abi: list, function_name: str) -> tuple:
+        """
+        Fetch or derive the 4-byte selector and input types of a function.
+
+        Walking the ABI and hashing the signature happens once per
+        (ABI, function); repeated writes in a loop hit the cache.
+        """
+        key = (self._abi_key(abi), function_name)
+        entry = self._calldata_cache.get(key)
+        if entry is None:
+            fn_abi = next(
+                e for e in abi
+                if e.get("type") == "function" and e.get("name") == function_name
+            )
+            selector = function_abi_to_4byte_selector(fn_abi)
+            arg_types = tuple(i["type"] for i in fn_abi.get("inputs", []))
+            entry = self._calldata_cache[key] = (selector, arg_types)
+        return entry
+
+    def encode_call(self, abi: list, function_name: str,
+                    args: list = None) -> bytes:
+        """
+        Encode raw calldata for a function call.
+
+        Hot loops (repeated writes, monitors) can build calldata directly
+        from the cached selector and argument types, skipping the
+        Contract.functions proxy and its per-call argument normalization.
+
+        Args:
+            abi: Contract ABI.
+            function_name: Name of the function to encode.
+            args: Function arguments.
+
+        Returns:
+            Selector plus ABI-encoded arguments.
+        """
+        selector, arg_types = self._fn_codec(abi, function_name)
+        if not args:
+            return selector
+        return selector + self.w3.codec.encode(list(arg_types), list(args))
+
     def call_function(self, contract_address: str, abi: list,
                      function_name: str, args: list = None) -> Dict:
         """
@@ -42,32 +248,275 @@ class ContractInteractor:
             Dictionary with success status and result.
         """
         try:
-            contract_address = Web3.to_checksum_address(contract_address)
-            contract = self.w3.eth.contract(address=contract_address, abi=abi)
-            
-            function = getattr(contract.functions, function_name)
-            
-            if args:
-                result = function(*args).call()
-            else:
-                result = function().call()
-            
+            contract_address = _checksum(contract_address)
+            contract = self._get_contract(contract_address, abi)
+
+            function = self._get_function(contract, function_name)
+
+            # Single call site: empty args degenerate to function().
+            args = tuple(args) if args else ()
+            result = function(*args).call()
+
             return {
                 "success": True,
                 "result": result,
                 "function": function_name
             }
         
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        except _RPC_ERRORS as e:
+            return {"success": False,
+                    "error_code": type(e).__name__,
+                    "error": str(e)}
     
+    def _get_nonce_and_gas_price(self, from_address: str) -> tuple:
+        """
+        Fetch the sender nonce and current gas price in one round-trip.
+
+        Both pre-flight reads are packed into a single JSON-RPC batch
+        request instead of two sequential HTTP round-trips; providers
+        without batch support fall back to the sequential calls.
+
+        Args:
+            from_address: Checksummed sender address.
+
+        Returns:
+            Tuple of (nonce, gas_price).
+        """
+        try:
+            with self.w3.batch_requests() as batch:
+                batch.add(self.w3.eth.get_transaction_count(from_address, 'pending'))
+                batch.add(self.w3.eth.gas_price)
+                nonce, gas_price = batch.execute()
+            return nonce, gas_price
+        except Exception:
+            return (self.w3.eth.get_transaction_count(from_address, 'pending'),
+                    self.w3.eth.gas_price)
+
+    def call_many(self, contract_address: str, abi: list,
+                  calls: list) -> Dict:
+        """
+        Call several read-only functions in one JSON-RPC batch request.
+
+        A menu action that reads N views costs one round-trip instead of
+        N. Falls back to sequential call_function on providers without
+        batch support.
+
+        Args:
+            contract_address: Target contract address.
+            abi: Contract ABI.
+            calls: List of (function_name, args) pairs; args may be None.
+
+        Returns:
+            Dictionary with success status and per-call results.
+        """
+        try:
+            contract_address = _checksum(contract_address)
+            contract = self._get_contract(contract_address, abi)
+
+            try:
+                with self.w3.batch_requests() as batch:
+                    for function_name, args in calls:
+                        function = self._get_function(contract, function_name)
+                        batch.add(function(*(args or [])).call())
+                    results = batch.execute()
+            except Exception:
+                results = [
+                    getattr(contract.functions, function_name)(*(args or [])).call()
+                    for function_name, args in calls
+                ]
+
+            return {
+                "success": True,
+                "results": [
+                    {"function": function_name, "result": result}
+                    for (function_name, _), result in zip(calls, results)
+                ]
+            }
+
+        except _RPC_ERRORS as e:
+            return {"success": False,
+                    "error_code": type(e).__name__,
+                    "error": str(e)}
+
+    def call_functions_multi(self, calls: list) -> Dict:
+        """
+        Aggregate several read-only calls into one eth_call via Multicall3.
+
+        Where call_many still costs the node one execution per view,
+        aggregate3 packs the calldata of every target into a single
+        on-chain trampoline: one round-trip, one EVM entry, regardless of
+        how many contracts are read.
+
+        Args:
+            calls: List of (contract_address, abi, function_name, args)
+                tuples; args may be None.
+
+        Returns:
+            Dictionary with success status and per-call decoded results.
+        """
+        try:
+            multicall = self.w3.eth.contract(
+                address=_checksum(_MULTICALL3_ADDRESS),
+                abi=_MULTICALL3_ABI
+            )
+
+            packed = []
+            output_types = []
+            for contract_address, abi, function_name, args in calls:
+                contract_address = _checksum(contract_address)
+                contract = self._get_contract(contract_address, abi)
+
+                # encode_abi in web3 v7, encodeABI before that
+                encode = getattr(contract, "encode_abi", None) or contract.encodeABI
+                packed.append(
+                    (contract_address, True, encode(function_name, args=args or [])))
+
+                entry = next(
+                    e for e in abi
+                    if e.get("type") == "function" and e.get("name") == function_name
+                )
+                output_types.append([o["type"] for o in entry.get("outputs", [])])
+
+            aggregated = multicall.functions.aggregate3(packed).call()
+
+            results = []
+            for (call_info, (ok, return_data), types) in zip(calls, aggregated, output_types):
+                if not ok:
+                    results.append({"success": False,
+                                    "function": call_info[2],
+                                    "error": "call reverted"})
+                    continue
+                decoded = self.w3.codec.decode(types, return_data)
+                results.append({
+                    "success": True,
+                    "function": call_info[2],
+                    "result": decoded[0] if len(decoded) == 1 else list(decoded)
+                })
+
+            return {"success": True, "results": results}
+
+        except _RPC_ERRORS as e:
+            return {"success": False,
+                    "error_code": type(e).__name__,
+                    "error": str(e)}
+
+    def _reserve_nonce_and_gas_price(self, from_address: str) -> tuple:
+        """
+        Reserve the next nonce for a sender and read the gas price.
+
+        The first send per sender syncs the nonce from the node (pending
+        count, batched with the gas price); subsequent sends take it from
+        the local counter under a lock, web3j FastRawTransactionManager
+        style. On nonce-related failures the counter is invalidated via
+        _forget_nonce so the next send re-syncs.
+        """
+        with self._nonce_lock:
+            cached = self._nonces.get(from_address)
+            if cached is not None:
+                self._nonces[from_address] = cached + 1
+        if cached is not None:
+            return cached, self.w3.eth.gas_price
+
+        nonce, gas_price = self._get_nonce_and_gas_price(from_address)
+        with self._nonce_lock:
+            self._nonces[from_address] = nonce + 1
+        return nonce, gas_price
+
+    def _forget_nonce(self, from_address: str):
+        """Drop the local nonce for a sender, forcing a node re-sync."""
+        with self._nonce_lock:
+            self._nonces.pop(from_address, None)
+
+    def _broadcast_raw(self, raw_transaction):
+        """
+        Fan a signed raw transaction out to every configured endpoint.
+
+        Submissions run concurrently and the first hash to come back
+        wins; the remaining tasks are cancelled. Duplicate submissions
+        are harmless (same hash, nodes dedup by content), so racing all
+        endpoints trades a little bandwidth for max-of-N propagation
+        speed and tolerance of one slow or dead node.
+
+        Returns:
+            The transaction hash from the fastest successful endpoint.
+        """
+        async def _race():
+            clients = [AsyncWeb3(AsyncHTTPProvider(url))
+                       for url in self._provider_urls]
+            tasks = {asyncio.create_task(c.eth.send_raw_transaction(raw_transaction))
+                     for c in clients}
+            last_error = None
+            try:
+                while tasks:
+                    done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None:
+                            return task.result()
+                        last_error = task.exception()
+                raise last_error
+            finally:
+                # Settle the losers, then close every provider session:
+                # each client owns an aiohttp ClientSession that would
+                # otherwise leak a connection per endpoint per send.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                for client in clients:
+                    disconnect = getattr(client.provider, "disconnect", None)
+                    if disconnect is not None:
+                        await disconnect()
+
+        return asyncio.run(_race())
+
+    def _send_raw_sync(self, raw_transaction):
+        """
+        Submit a raw transaction via eth_sendRawTransactionSync.
+
+        Nodes that implement it (EIP-7966) block until inclusion and
+        return the receipt in the submission response - one round-trip
+        instead of send + a poll per interval until the receipt lands.
+
+        Returns:
+            The receipt, or None when the endpoint lacks the method.
+        """
+        try:
+            receipt = self.w3.manager.request_blocking(
+                'eth_sendRawTransactionSync', [Web3.to_hex(raw_transaction)])
+        except Exception:
+            return None
+        if receipt is None:
+            return None
+        return self._normalize_sync_receipt(receipt)
+
+    @staticmethod
+    def _normalize_sync_receipt(receipt):
+        """
+        Normalize a raw eth_sendRawTransactionSync receipt.
+
+        The method is non-standard, so web3 applies no result formatter:
+        every field arrives as a hex string. Convert the fields the
+        caller reads to the same shapes wait_for_transaction_receipt
+        yields - HexBytes hash, int block number / gas / status - so the
+        sync and polling paths feed one return block.
+        """
+        def to_int(value):
+            return int(value, 16) if isinstance(value, str) else value
+
+        normalized = dict(receipt)
+        normalized["transactionHash"] = HexBytes(receipt["transactionHash"])
+        normalized["blockNumber"] = to_int(receipt["blockNumber"])
+        normalized["gasUsed"] = to_int(receipt["gasUsed"])
+        normalized["status"] = to_int(receipt["status"])
+        return normalized
+
     def send_transaction(self, contract_address: str, abi: list,
                         function_name: str, from_address: str,
                         private_key: str, args: list = None,
-                        value: int = 0) -> Dict:
+                        value: int = 0, sync_submit: bool = False) -> Dict:
         """
         Send a state-changing transaction to the contract.
-        
+
         Args:
             contract_address: Target contract address.
             abi: Contract ABI.
@@ -76,39 +525,47 @@ class ContractInteractor:
             private_key: Sender's private key.
             args: Function arguments.
             value: ETH value to send (in wei).
-        
+            sync_submit: Try eth_sendRawTransactionSync so submission and
+                receipt cost one round-trip; falls back to the polling
+                path when the node lacks the method.
+
         Returns:
             Dictionary with transaction receipt details.
         """
         try:
-            contract_address = Web3.to_checksum_address(contract_address)
-            from_address = Web3.to_checksum_address(from_address)
-            
-            contract = self.w3.eth.contract(address=contract_address, abi=abi)
-            function = getattr(contract.functions, function_name)
+            contract_address = _checksum(contract_address)
+            from_address = _checksum(from_address)
             
-            nonce = self.w3.eth.get_transaction_count(from_address)
-            
-            if args:
-                tx = function(*args).build_transaction({
-                    "from": from_address,
-                    "nonce": nonce,
-                    "value": value,
-                    "gas": 1000000,
-                    "gasPrice": self.w3.eth.gas_price
-                })
-            else:
-                tx = function().build_transaction({
-                    "from": from_address,
-                    "nonce": nonce,
-                    "value": value,
-                    "gas": 1000000,
-                    "gasPrice": self.w3.eth.gas_price
-                })
+            contract = self._get_contract(contract_address, abi)
+            function = self._get_function(contract, function_name)
+
+            nonce, gas_price = self._reserve_nonce_and_gas_price(from_address)
+
+            # One build site instead of twin if/else dicts that used to
+            # have to be kept in sync.
+            args = tuple(args) if args else ()
+            tx = function(*args).build_transaction({
+                "from": from_address,
+                "nonce": nonce,
+                "value": value,
+                "gas": 1000000,
+                "gasPrice": gas_price
+            })
             
             signed_tx = self.w3.eth.account.sign_transaction(tx, private_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+
+            receipt = None
+            if sync_submit:
+                receipt = self._send_raw_sync(signed_tx.raw_transaction)
+
+            if receipt is not None:
+                tx_hash = receipt["transactionHash"]
+            else:
+                if len(self._provider_urls) > 1:
+                    tx_hash = self._broadcast_raw(signed_tx.raw_transaction)
+                else:
+                    tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
             
             return {
                 "success": True,
@@ -118,52 +575,88 @@ class ContractInteractor:
                 "status": "Success" if receipt["status"] else "Failed"
             }
         
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
+        except _RPC_ERRORS as e:
+            # A stale local counter shows up as a nonce error; drop it so
+            # the next send re-syncs from the node.
+            message = str(e)
+            if "nonce" in message.lower() or "known transaction" in message.lower():
+                self._forget_nonce(from_address)
+            return {"success": False,
+                    "error_code": type(e).__name__,
+                    "error": message}
+
     def get_events(self, contract_address: str, abi: list,
-                  event_name: str, from_block: int = 0) -> Dict:
+                  event_name: str, from_block: int = 0,
+                  to_block='latest', block_step: int = 2000) -> Dict:
         """
         Retrieve emitted events from the contract.
-        
+
+        The scan is issued in bounded block windows rather than one
+        unbounded from_block=0 query: hosted providers cap (or reject)
+        full-range eth_getLogs, and on long chains a single request would
+        make the node walk the entire history in one go.
+
         Args:
             contract_address: Target contract address.
             abi: Contract ABI.
             event_name: Name of the event.
             from_block: Starting block number.
-        
+            to_block: Final block number, or 'latest'.
+            block_step: Blocks per eth_getLogs window.
+
         Returns:
             Dictionary with event logs.
         """
         try:
-            contract_address = Web3.to_checksum_address(contract_address)
-            contract = self.w3.eth.contract(address=contract_address, abi=abi)
-            
+            contract_address = _checksum(contract_address)
+            contract = self._get_contract(contract_address, abi)
+
             event = getattr(contract.events, event_name)
-            events = event.get_logs(from_block=from_block)
+
+            head = self.w3.eth.block_number if to_block == 'latest' else to_block
+            if isinstance(head, int):
+                events = []
+                for start in range(from_block, head + 1, block_step):
+                    events.extend(event.get_logs(
+                        from_block=start,
+                        to_block=min(start + block_step - 1, head)))
+            else:
+                # No numeric head available; fall back to one ranged query.
+                events = event.get_logs(from_block=from_block, to_block=to_block)
             
             return {
                 "success": True,
                 "event_name": event_name,
                 "count": len(events),
-                "events": [dict(e) for e in events]
+                # AttributeDicts pass through as-is: they already support
+                # mapping access, and rebuilding a plain dict per log is
+                # O(fields) allocations apiece on multi-thousand-log scans.
+                "events": events
             }
         
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        except _RPC_ERRORS as e:
+            return {"success": False,
+                    "error_code": type(e).__name__,
+                    "error": str(e)}
+
 
+def demo_interactive(deployment_path: str = "deployment.json"):
+    """Interactive demo using a deployment artifact file.
 
-def demo_interactive():
-    """Interactive demo using deployment.json file."""
+    Args:
+        deployment_path: Path to the deployment artifact; taking it as a
+            parameter lets callers (and tests) point at a temp location
+            without changing the working directory.
+    """
     print("="*60)
     print("Smart Contract Interaction Demo")
     print("="*60 + "\n")
-    
+
     try:
-        with open("deployment.json", "r") as f:
-            deployment = json.load(f)
+        with open(deployment_path, "rb") as f:
+            deployment = orjson.loads(f.read()) if orjson is not None else json.load(f)
     except FileNotFoundError:
-        print("Error: deployment.json not found")
+        print(f"Error: {deployment_path} not found")
         print("Please run deploy.py first")
         return
     
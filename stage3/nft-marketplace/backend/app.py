@@ -1,17 +1,55 @@
-from flask import Flask, request, jsonify
+# Cooperative I/O: patch the stdlib before anything else imports socket/ssl
+# so web3 JSON-RPC round-trips park a greenlet instead of blocking the whole
+# worker. Serve with:
+#   gunicorn -k gevent -w $((2 * $(nproc) + 1)) --worker-connections 1000 app:app
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass  # plain blocking I/O under the dev server / sync workers
+
+from flask import Flask, g, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager, jwt_required, create_access_token, get_jwt_identity
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import raiseload, selectinload
 import os
-from datetime import datetime
-import bcrypt
+from datetime import datetime, timezone
+from time import time as _time
 from dotenv import load_dotenv
 
+# orjson encodes the list-of-dict payloads of the list endpoints several
+# times faster than the stdlib encoder behind jsonify. Optional - the app
+# keeps Flask's default JSON provider without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+
+class _OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
 CORS(app)
 
 # Configuration
@@ -20,25 +58,123 @@ app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'jwt-secret-key')
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///nft_marketplace.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Connection pool tuning: reuse warm connections across requests instead of
+# opening one per request, ping stale connections before handing them out,
+# and recycle them before typical idle-timeout windows.
+_engine_options = {
+    'pool_size': 20,
+    'max_overflow': 10,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+}
+if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    # The pool shares connections between worker threads; SQLite objects
+    # to that by default.
+    _engine_options['connect_args'] = {'check_same_thread': False}
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = _engine_options
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Put SQLite into WAL mode so readers no longer block on writers."""
+    if 'sqlite3' not in type(dbapi_connection).__module__:
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA busy_timeout=5000')
+    cursor.close()
+
 # Initialize extensions
 db = SQLAlchemy(app)
 jwt = JWTManager(app)
 
+# Query-count guardrail: a request that suddenly issues dozens of SQL
+# statements is almost always an accidental N+1 (e.g. a relationship
+# added without eager loading). Count per request and log loudly past
+# the threshold so the regression surfaces before it becomes a latency
+# incident. In debug, recorded queries can additionally be inspected via
+# flask_sqlalchemy.record_queries.get_recorded_queries().
+app.config['SQLALCHEMY_RECORD_QUERIES'] = app.debug
+
+_QUERY_WARN_THRESHOLD = 10
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    try:
+        g.query_count = getattr(g, 'query_count', 0) + 1
+    except RuntimeError:
+        pass  # outside a request context (init_db, shells, background jobs)
+
+
+@app.after_request
+def _warn_on_query_storm(response):
+    count = getattr(g, 'query_count', 0)
+    if count > _QUERY_WARN_THRESHOLD:
+        app.logger.warning(
+            '%s issued %d SQL queries (threshold %d) - possible N+1',
+            request.path, count, _QUERY_WARN_THRESHOLD)
+    return response
+
 # Web3 setup
 GANACHE_URL = os.getenv('GANACHE_URL', 'http://127.0.0.1:8545')
 CONTRACT_ADDRESS = os.getenv('CONTRACT_ADDRESS', '0x5FbDB2315678afecb367f032d93F642f64180aa3')
 
-web3 = Web3(Web3.HTTPProvider(GANACHE_URL))
+# Pooled keep-alive session: RPC calls reuse warm connections to the node
+# instead of paying a TCP handshake each, with a short retry on hiccups.
+_rpc_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.1),
+)
+_rpc_session = requests.Session()
+_rpc_session.mount('http://', _rpc_adapter)
+_rpc_session.mount('https://', _rpc_adapter)
+
+web3 = Web3(Web3.HTTPProvider(
+    GANACHE_URL,
+    session=_rpc_session,
+    request_kwargs={'timeout': 10},
+))
 if not web3.is_connected():
     print("Warning: Could not connect to Ganache")
 
+def iso_now():
+    """Current UTC time in ISO-8601, without the deprecated utcnow()."""
+    return datetime.fromtimestamp(_time(), tz=timezone.utc).isoformat()
+
+# is_connected() costs an eth_chainId RPC; health probes arrive at a fixed
+# rate per instance, so cache the answer for a second to bound the RPC
+# load from health checks to at most 1 QPS per process.
+_CONNECTED_TTL = 1.0
+_connected_cache = {'value': False, 'expires': 0.0}
+
+def _web3_connected():
+    now = _time()
+    if now >= _connected_cache['expires']:
+        _connected_cache['value'] = web3.is_connected()
+        _connected_cache['expires'] = now + _CONNECTED_TTL
+    return _connected_cache['value']
+
 # Database Models
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     wallet_address = db.Column(db.String(42), unique=True, nullable=False)
     username = db.Column(db.String(50), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=func.now())
+
+    # NFTs created by this user, joined on wallet address (the schema has
+    # no FK column). lazy='raise' makes any accidental lazy load blow up
+    # immediately instead of silently issuing N+1 queries; routes opt in
+    # with selectinload.
+    nfts = db.relationship(
+        'NFTMetadata',
+        primaryjoin='User.wallet_address == foreign(NFTMetadata.creator_address)',
+        viewonly=True,
+        lazy='raise',
+    )
 
 class NFTMetadata(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -47,7 +183,13 @@ class NFTMetadata(db.Model):
     description = db.Column(db.Text)
     image_url = db.Column(db.String(500))
     creator_address = db.Column(db.String(42), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=func.now())
+
+    # get_user_profile filters on creator_address; without the index that
+    # is a full table scan per profile view.
+    __table_args__ = (
+        db.Index('ix_nft_creator', 'creator_address'),
+    )
 
 class Transaction(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -58,7 +200,47 @@ class Transaction(db.Model):
     transaction_type = db.Column(db.String(20), nullable=False)  # mint, transfer, sale
     price = db.Column(db.Float)  # in ETH
     block_number = db.Column(db.Integer)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    timestamp = db.Column(db.DateTime, server_default=func.now())
+
+    # Composite indexes matching the hot access paths: token history
+    # (filter token_id, order timestamp DESC) and recent sales (filter
+    # transaction_type, order timestamp DESC). Both turn sort-the-table
+    # into an index range scan.
+    __table_args__ = (
+        db.Index('ix_tx_token_ts', 'token_id', 'timestamp'),
+        db.Index('ix_tx_type_ts', 'transaction_type', 'timestamp'),
+    )
+
+# Rows per Core bulk-insert statement.
+_BULK_BATCH_SIZE = 1000
+
+
+def _bulk_insert_transactions(rows):
+    """Insert a batch of transaction rows, silently skipping known hashes.
+
+    One Core insert with ON CONFLICT DO NOTHING per 1000-row batch and a
+    single commit: one prepared statement and one fsync per batch instead
+    of a flush per db.session.add(), which is orders of magnitude slower
+    at ingest volume.
+    """
+    if not rows:
+        return 0
+
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as _insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as _insert
+
+    inserted = 0
+    for start in range(0, len(rows), _BULK_BATCH_SIZE):
+        stmt = _insert(Transaction.__table__).values(
+            rows[start:start + _BULK_BATCH_SIZE]
+        ).on_conflict_do_nothing(index_elements=['transaction_hash'])
+        result = db.session.execute(stmt)
+        inserted += result.rowcount or 0
+    db.session.commit()
+    return inserted
+
 
 # Routes
 @app.route('/api/health', methods=['GET'])
@@ -66,8 +248,8 @@ def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'web3_connected': web3.is_connected(),
-        'timestamp': datetime.utcnow().isoformat()
+        'web3_connected': _web3_connected(),
+        'timestamp': iso_now()
     })
 
 @app.route('/api/auth/register', methods=['POST'])
@@ -152,26 +334,35 @@ def get_nfts():
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 20, type=int)
 
-        nfts = NFTMetadata.query.paginate(page=page, per_page=per_page)
-
-        result = []
-        for nft in nfts.items:
-            result.append({
-                'token_id': nft.token_id,
-                'name': nft.name,
-                'description': nft.description,
-                'image_url': nft.image_url,
-                'creator_address': nft.creator_address,
-                'created_at': nft.created_at.isoformat()
-            })
+        # Core-level column select: only the serialized columns are fetched
+        # and no ORM objects are hydrated (no identity map / instrumentation
+        # per row), which is markedly cheaper than Query.paginate here.
+        total = db.session.scalar(select(func.count()).select_from(NFTMetadata))
+        rows = db.session.execute(
+            select(NFTMetadata.token_id, NFTMetadata.name,
+                   NFTMetadata.description, NFTMetadata.image_url,
+                   NFTMetadata.creator_address, NFTMetadata.created_at)
+            .order_by(NFTMetadata.token_id)
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+        ).all()
+
+        result = [{
+            'token_id': row.token_id,
+            'name': row.name,
+            'description': row.description,
+            'image_url': row.image_url,
+            'creator_address': row.creator_address,
+            'created_at': row.created_at.isoformat()
+        } for row in rows]
 
         return jsonify({
             'nfts': result,
             'pagination': {
                 'page': page,
                 'per_page': per_page,
-                'total': nfts.total,
-                'pages': nfts.pages
+                'total': total,
+                'pages': (total + per_page - 1) // per_page
             }
         })
 
@@ -251,63 +442,120 @@ def get_transactions():
         per_page = request.args.get('per_page', 50, type=int)
         token_id = request.args.get('token_id', type=int)
 
-        query = Transaction.query
+        # Same Core-level pattern as get_nfts: fetch only the serialized
+        # columns as plain rows instead of hydrating Transaction objects.
+        stmt = select(Transaction.transaction_hash, Transaction.token_id,
+                      Transaction.from_address, Transaction.to_address,
+                      Transaction.transaction_type, Transaction.price,
+                      Transaction.block_number, Transaction.timestamp)
+        count_stmt = select(func.count()).select_from(Transaction)
 
         if token_id:
-            query = query.filter_by(token_id=token_id)
-
-        transactions = query.order_by(Transaction.timestamp.desc()).paginate(page=page, per_page=per_page)
-
-        result = []
-        for tx in transactions.items:
-            result.append({
-                'transaction_hash': tx.transaction_hash,
-                'token_id': tx.token_id,
-                'from_address': tx.from_address,
-                'to_address': tx.to_address,
-                'transaction_type': tx.transaction_type,
-                'price': tx.price,
-                'block_number': tx.block_number,
-                'timestamp': tx.timestamp.isoformat()
-            })
+            stmt = stmt.where(Transaction.token_id == token_id)
+            count_stmt = count_stmt.where(Transaction.token_id == token_id)
+
+        total = db.session.scalar(count_stmt)
+        rows = db.session.execute(
+            stmt.order_by(Transaction.timestamp.desc())
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+        ).all()
+
+        result = [{
+            'transaction_hash': row.transaction_hash,
+            'token_id': row.token_id,
+            'from_address': row.from_address,
+            'to_address': row.to_address,
+            'transaction_type': row.transaction_type,
+            'price': row.price,
+            'block_number': row.block_number,
+            'timestamp': row.timestamp.isoformat()
+        } for row in rows]
 
         return jsonify({
             'transactions': result,
             'pagination': {
                 'page': page,
                 'per_page': per_page,
-                'total': transactions.total,
-                'pages': transactions.pages
+                'total': total,
+                'pages': (total + per_page - 1) // per_page
             }
         })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/transactions/bulk', methods=['POST'])
+@jwt_required()
+def ingest_transactions():
+    """Bulk-ingest blockchain transactions (e.g. from an event indexer)"""
+    try:
+        data = request.get_json()
+
+        if not data or not isinstance(data.get('transactions'), list):
+            return jsonify({'error': 'transactions list required'}), 400
+
+        rows = []
+        for tx in data['transactions']:
+            if not tx.get('transaction_hash') or not tx.get('to_address') \
+                    or not tx.get('transaction_type') or tx.get('token_id') is None:
+                return jsonify({'error': 'Missing required fields'}), 400
+            rows.append({
+                'transaction_hash': tx['transaction_hash'],
+                'token_id': tx['token_id'],
+                'from_address': tx.get('from_address'),
+                'to_address': tx['to_address'],
+                'transaction_type': tx['transaction_type'],
+                'price': tx.get('price'),
+                'block_number': tx.get('block_number'),
+            })
+
+        inserted = _bulk_insert_transactions(rows)
+
+        return jsonify({
+            'message': 'Transactions ingested successfully',
+            'received': len(rows),
+            'inserted': inserted
+        }), 201
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/marketplace/stats', methods=['GET'])
 def get_marketplace_stats():
     """Get marketplace statistics"""
     try:
-        total_nfts = NFTMetadata.query.count()
-        total_transactions = Transaction.query.count()
-        unique_creators = db.session.query(NFTMetadata.creator_address).distinct().count()
-
-        # Get recent sales
-        recent_sales = Transaction.query.filter_by(transaction_type='sale')\
-            .order_by(Transaction.timestamp.desc()).limit(5).all()
-
-        sales_data = []
-        for sale in recent_sales:
-            sales_data.append({
-                'token_id': sale.token_id,
-                'price': sale.price,
-                'timestamp': sale.timestamp.isoformat()
-            })
+        # All three aggregates in one round-trip via scalar subqueries
+        # instead of three separate COUNT statements.
+        counts = db.session.execute(select(
+            select(func.count()).select_from(NFTMetadata)
+            .scalar_subquery().label('total_nfts'),
+            select(func.count()).select_from(Transaction)
+            .scalar_subquery().label('total_transactions'),
+            select(func.count(func.distinct(NFTMetadata.creator_address)))
+            .scalar_subquery().label('unique_creators'),
+        )).one()
+
+        # Recent sales ride the (transaction_type, timestamp) index.
+        recent_sales = db.session.execute(
+            select(Transaction.token_id, Transaction.price,
+                   Transaction.timestamp)
+            .where(Transaction.transaction_type == 'sale')
+            .order_by(Transaction.timestamp.desc())
+            .limit(5)
+        ).all()
+
+        sales_data = [{
+            'token_id': sale.token_id,
+            'price': sale.price,
+            'timestamp': sale.timestamp.isoformat()
+        } for sale in recent_sales]
 
         return jsonify({
-            'total_nfts': total_nfts,
-            'total_transactions': total_transactions,
-            'unique_creators': unique_creators,
+            'total_nfts': counts.total_nfts,
+            'total_transactions': counts.total_transactions,
+            'unique_creators': counts.unique_creators,
             'recent_sales': sales_data
         })
 
@@ -325,21 +573,24 @@ def get_user_profile(wallet_address):
         if current_user != wallet_address:
             return jsonify({'error': 'Unauthorized'}), 403
 
-        user = User.query.filter_by(wallet_address=wallet_address).first()
+        # One user select plus one selectin batch for the NFTs — exactly
+        # two statements regardless of NFT count; raiseload guards against
+        # any other relationship lazy-loading behind our back.
+        user = db.session.execute(
+            select(User)
+            .options(selectinload(User.nfts), raiseload('*'))
+            .where(User.wallet_address == wallet_address)
+        ).scalar_one_or_none()
         if not user:
             return jsonify({'error': 'User not found'}), 404
 
-        # Get user's NFTs
-        user_nfts = NFTMetadata.query.filter_by(creator_address=wallet_address).all()
-        nfts_data = []
-        for nft in user_nfts:
-            nfts_data.append({
-                'token_id': nft.token_id,
-                'name': nft.name,
-                'description': nft.description,
-                'image_url': nft.image_url,
-                'created_at': nft.created_at.isoformat()
-            })
+        nfts_data = [{
+            'token_id': nft.token_id,
+            'name': nft.name,
+            'description': nft.description,
+            'image_url': nft.image_url,
+            'created_at': nft.created_at.isoformat()
+        } for nft in user.nfts]
 
         return jsonify({
             'user': {
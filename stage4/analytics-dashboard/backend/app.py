@@ -4,22 +4,62 @@ NFT Marketplace Analytics Dashboard - Backend Service
 Queries Hardhat blockchain for real-time marketplace metrics
 """
 
+# Cooperative I/O: patch the stdlib before anything else imports socket/ssl
+# so the sequential Hardhat RPC calls park a greenlet instead of blocking the
+# worker. Socket.IO keeps working under:
+#   gunicorn -k geventwebsocket.gunicorn.workers.GeventWebSocketWorker -w 1 app:app
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass  # plain blocking I/O under the dev server
+
+import heapq
 import json
 import os
+import threading
+import time
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import requests
 from dotenv import load_dotenv
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 
+# orjson encodes the metrics/transaction payloads several times faster
+# than the stdlib encoder; with a 5s broadcast cadence the serializer is
+# on the hot path. Optional - Flask's default provider is kept without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+
+class _OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'dev-secret-key-change-in-production'
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
 CORS(app)
 socketio = SocketIO(app, cors_allowed_origins="*")
 
@@ -27,7 +67,27 @@ socketio = SocketIO(app, cors_allowed_origins="*")
 HARDHAT_URL = os.getenv('HARDHAT_URL', 'http://127.0.0.1:8545')
 CONTRACT_ADDRESS = os.getenv('CONTRACT_ADDRESS', '0x5FbDB2315678afecb367f032d93F642f64180aa3')
 
-w3 = Web3(Web3.HTTPProvider(HARDHAT_URL))
+# Checksummed once at import: to_checksum_address runs a keccak256, so it
+# has no business on the per-request path.
+CONTRACT_ADDRESS_CHECKSUMMED = Web3.to_checksum_address(CONTRACT_ADDRESS)
+
+# One pooled keep-alive session for every RPC call: connections to the
+# node are reused instead of re-handshaken per request, and transient
+# hiccups get a short retry with backoff.
+_rpc_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.1),
+)
+_rpc_session = requests.Session()
+_rpc_session.mount('http://', _rpc_adapter)
+_rpc_session.mount('https://', _rpc_adapter)
+
+w3 = Web3(Web3.HTTPProvider(
+    HARDHAT_URL,
+    session=_rpc_session,
+    request_kwargs={'timeout': 10},
+))
 
 # Load contract ABI
 CONTRACT_ABI_PATH = Path('../../../stage3/nft-marketplace/smart-contracts/artifacts/contracts/NFTMarketplace.sol/NFTMarketplace.json')
@@ -50,7 +110,7 @@ contract = None
 if contract_abi and w3.is_connected():
     try:
         contract = w3.eth.contract(
-            address=Web3.to_checksum_address(CONTRACT_ADDRESS),
+            address=CONTRACT_ADDRESS_CHECKSUMMED,
             abi=contract_abi
         )
         print(f"✅ Connected to Hardhat: {HARDHAT_URL}")
@@ -60,23 +120,233 @@ if contract_abi and w3.is_connected():
 else:
     print(f"⚠️  Not connected to Hardhat or ABI not loaded")
 
-# Cache for metrics (simple in-memory cache)
+# Metrics cache. With Redis available the cache is shared across every
+# worker process (one refresh per expiry for the whole deployment, not one
+# per worker), with stale-while-revalidate semantics: on expiry a single
+# worker takes the refresh lock while the rest keep serving the stale copy.
+# Without Redis we fall back to the per-process dict.
+REDIS_URL = os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/0')
+try:
+    import redis as _redis
+    redis_client = _redis.Redis.from_url(REDIS_URL)
+    redis_client.ping()
+    print(f"✅ Metrics cache backed by Redis: {REDIS_URL}")
+except Exception:
+    redis_client = None
+
 metrics_cache = {
     'last_update': None,
     'data': None
 }
 
-CACHE_DURATION = 10  # seconds
+CACHE_DURATION = 10   # seconds a fresh copy is served as-is
+STALE_DURATION = 60   # seconds the stale copy stays usable during refresh
+LOCK_TIMEOUT = 15     # refresh lock auto-expires if the holder dies
+
+_METRICS_KEY = 'marketplace:metrics'
+_METRICS_STALE_KEY = 'marketplace:metrics:stale'
+_METRICS_LOCK_KEY = 'marketplace:metrics:lock'
+
+_ZERO_ADDRESS = '0x0000000000000000000000000000000000000000'
+
+# Bound event instances, resolved once per process. Going through
+# contract.events.X repeats a descriptor walk plus an ABI fragment lookup
+# on every call; the bound instances carry all of that pre-resolved.
+_event_factories = None
+
+def _get_event_factories():
+    global _event_factories
+    if _event_factories is None:
+        _event_factories = (contract.events.Transfer(),
+                            contract.events.NFTListed(),
+                            contract.events.NFTSold())
+    return _event_factories
+
+# topic0 signature hash -> bound event instance, built once per process.
+_topic_dispatch = None
+
+def _get_topic_dispatch():
+    global _topic_dispatch
+    if _topic_dispatch is None:
+        _topic_dispatch = {
+            event.build_filter().topics[0]: event
+            for event in _get_event_factories()
+        }
+    return _topic_dispatch
+
+if contract is not None:
+    # Precompute the topic signature hashes at import so the first
+    # request does not pay the keccak + filter-encoding work.
+    _get_topic_dispatch()
+
+# Incremental event index. Every refresh used to rescan the whole
+# 10k-block window; instead the decoded events are accumulated here and
+# each refresh only fetches last_block+1 -> current, so steady-state cost
+# is O(new blocks). The service has no database layer, so the cursor and
+# rows live in-process: a restart rescans the initial window once, and a
+# chain reset (current block below the cursor) drops the index and starts
+# over.
+_event_index = {
+    'last_block': None,
+    'mints': [],
+    'listings': [],
+    'sales': [],
+}
+_event_index_lock = threading.Lock()
+
+def _indexed_marketplace_events(current_block):
+    """Return (mints, listings, sales) up to current_block, indexing deltas."""
+    with _event_index_lock:
+        last = _event_index['last_block']
+        if last is None or current_block < last:
+            _event_index['mints'] = []
+            _event_index['listings'] = []
+            _event_index['sales'] = []
+            start = max(0, current_block - 10000)
+        elif current_block > last:
+            start = last + 1
+        else:
+            start = None  # nothing new
+
+        if start is not None:
+            mints, listings, sales = _fetch_marketplace_events(start, current_block)
+            _event_index['mints'].extend(mints)
+            _event_index['listings'].extend(listings)
+            _event_index['sales'].extend(sales)
+            _event_index['last_block'] = current_block
+
+        return (list(_event_index['mints']),
+                list(_event_index['listings']),
+                list(_event_index['sales']))
+
+# The listing fee only changes on an admin transaction, yet every cold
+# metrics refresh paid a full eth_call round-trip to re-read it. Cache it
+# with a generous TTL so the refresh path usually costs zero extra RPC.
+_LISTING_FEE_TTL = 300  # seconds
+_listing_fee_cache = {'value': None, 'expires': 0.0}
+
+def _cached_listing_fee():
+    now = time.monotonic()
+    if _listing_fee_cache['value'] is None or now >= _listing_fee_cache['expires']:
+        _listing_fee_cache['value'] = contract.functions.listingFee().call()
+        _listing_fee_cache['expires'] = now + _LISTING_FEE_TTL
+    return _listing_fee_cache['value']
+
+def _fetch_marketplace_events(from_block, to_block='latest'):
+    """Fetch mint, listing and sale events for the window in one RPC.
+
+    A single eth_getLogs with an OR'd topic0 array replaces three filter
+    installs plus three getFilterLogs round-trips, and the node scans the
+    block range once instead of three times. Each raw log is dispatched to
+    its event ABI by signature hash; Transfer logs are kept only when they
+    are mints (from == zero address).
+    """
+    try:
+        dispatch = _get_topic_dispatch()
+        logs = w3.eth.get_logs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': contract.address,
+            'topics': [list(dispatch)],
+        })
+    except Exception:
+        # Nodes without getLogs topic-array support: fall back to the
+        # concurrent per-event filters.
+        return _fetch_marketplace_events_filters(from_block, to_block)
+
+    mints, listings, sales = [], [], []
+    buckets = {'NFTListed': listings, 'NFTSold': sales}
+    for log in logs:
+        event = dispatch.get(Web3.to_hex(log['topics'][0]))
+        if event is None:
+            continue
+        decoded = event.process_log(log)
+        if decoded.event == 'Transfer':
+            if decoded.args['from'] == _ZERO_ADDRESS:
+                mints.append(decoded)
+        else:
+            buckets[decoded.event].append(decoded)
+    return mints, listings, sales
+
+def _fetch_marketplace_events_filters(from_block, to_block='latest'):
+    """Per-event filter fetch, run concurrently.
+
+    The three queries are independent JSON-RPC round-trips, so running
+    them in a small pool turns 3x RTT into 1x. Under the gevent patch the
+    workers cooperate as greenlets; otherwise real threads overlap the
+    socket waits just as well.
+    """
+    transfer, listed, sold = _get_event_factories()
+
+    def fetch_mints():
+        return transfer.create_filter(
+            from_block=from_block,
+            to_block=to_block,
+            argument_filters={'from': _ZERO_ADDRESS}
+        ).get_all_entries()
+
+    def fetch_listings():
+        return listed.create_filter(
+            from_block=from_block,
+            to_block=to_block
+        ).get_all_entries()
+
+    def fetch_sales():
+        return sold.create_filter(
+            from_block=from_block,
+            to_block=to_block
+        ).get_all_entries()
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        mints, listings, sales = pool.map(
+            lambda fetch: fetch(), (fetch_mints, fetch_listings, fetch_sales))
+    return mints, listings, sales
 
 def get_marketplace_metrics():
-    """Get comprehensive marketplace metrics from blockchain"""
-    
-    # Check cache
+    """Get marketplace metrics, served from cache whenever possible"""
+
+    if redis_client is not None:
+        try:
+            blob = redis_client.get(_METRICS_KEY)
+            if blob:
+                return json.loads(blob)
+
+            # Cache miss: only the lock winner recomputes; losers serve the
+            # stale copy so expiry never causes a thundering herd of RPC.
+            if not redis_client.set(_METRICS_LOCK_KEY, '1', nx=True, ex=LOCK_TIMEOUT):
+                stale = redis_client.get(_METRICS_STALE_KEY)
+                if stale:
+                    return json.loads(stale)
+        except Exception:
+            pass  # Redis down: compute directly
+
+        metrics = _compute_marketplace_metrics()
+
+        if metrics.get('connected'):
+            try:
+                blob = json.dumps(metrics)
+                redis_client.setex(_METRICS_KEY, CACHE_DURATION, blob)
+                redis_client.setex(_METRICS_STALE_KEY, STALE_DURATION, blob)
+                redis_client.delete(_METRICS_LOCK_KEY)
+            except Exception:
+                pass
+        return metrics
+
+    # Per-process fallback cache
     if metrics_cache['last_update']:
         elapsed = (datetime.now() - metrics_cache['last_update']).seconds
         if elapsed < CACHE_DURATION and metrics_cache['data']:
             return metrics_cache['data']
-    
+
+    metrics = _compute_marketplace_metrics()
+    if metrics.get('connected'):
+        metrics_cache['data'] = metrics
+        metrics_cache['last_update'] = datetime.now()
+    return metrics
+
+def _compute_marketplace_metrics():
+    """Recompute marketplace metrics from the blockchain"""
+
     if not contract:
         return {
             'error': 'Contract not loaded',
@@ -87,28 +357,9 @@ def get_marketplace_metrics():
         # Get current block
         current_block = w3.eth.block_number
         
-        # Query past events
-        from_block = max(0, current_block - 10000)  # Last 10k blocks
-        
-        # Get minting events
-        mint_filter = contract.events.Transfer.create_filter(
-            from_block=from_block,
-            argument_filters={'from': '0x0000000000000000000000000000000000000000'}
-        )
-        mint_events = mint_filter.get_all_entries()
-        
-        # Get listing events  
-        listing_filter = contract.events.NFTListed.create_filter(
-            from_block=from_block
-        )
-        listing_events = listing_filter.get_all_entries()
-        
-        # Get sale events
-        sale_filter = contract.events.NFTSold.create_filter(
-            from_block=from_block
-        )
-        sale_events = sale_filter.get_all_entries()
-        
+        # Query past events through the incremental index
+        mint_events, listing_events, sale_events = _indexed_marketplace_events(current_block)
+
         # Calculate metrics
         total_nfts_minted = len(mint_events)
         total_listings = len(listing_events)
@@ -130,8 +381,8 @@ def get_marketplace_metrics():
         listed_token_ids = {event.args.tokenId for event in listing_events}
         active_listings = len(listed_token_ids - sold_token_ids)
         
-        # Get listing fee
-        listing_fee = w3.from_wei(contract.functions.listingFee().call(), 'ether')
+        # Get listing fee (TTL-cached; it only changes on an admin tx)
+        listing_fee = w3.from_wei(_cached_listing_fee(), 'ether')
         
         metrics = {
             'connected': True,
@@ -147,10 +398,6 @@ def get_marketplace_metrics():
             'timestamp': datetime.now().isoformat()
         }
         
-        # Update cache
-        metrics_cache['data'] = metrics
-        metrics_cache['last_update'] = datetime.now()
-        
         return metrics
         
     except Exception as e:
@@ -160,6 +407,40 @@ def get_marketplace_metrics():
             'connected': False
         }
 
+def _format_mint(event):
+    return {
+        'type': 'mint',
+        'token_id': event.args.tokenId,
+        'address': event.args.to,
+        'block': event.blockNumber,
+        'tx_hash': event.transactionHash.hex()
+    }
+
+def _format_listing(event):
+    return {
+        'type': 'list',
+        'token_id': event.args.tokenId,
+        'seller': event.args.seller,
+        'price_eth': float(w3.from_wei(event.args.price, 'ether')),
+        'block': event.blockNumber,
+        'tx_hash': event.transactionHash.hex()
+    }
+
+def _format_sale(event):
+    return {
+        'type': 'sale',
+        'token_id': event.args.tokenId,
+        'buyer': event.args.buyer,
+        'seller': event.args.seller,
+        'price_eth': float(w3.from_wei(event.args.price, 'ether')),
+        'block': event.blockNumber,
+        'tx_hash': event.transactionHash.hex()
+    }
+
+def _descending_stream(events, formatter):
+    """Yield (block, formatter, event) for an in-block-order list, newest first."""
+    return ((event.blockNumber, formatter, event) for event in reversed(events))
+
 def get_recent_transactions(limit=20):
     """Get recent marketplace transactions"""
     if not contract:
@@ -167,64 +448,41 @@ def get_recent_transactions(limit=20):
     
     try:
         current_block = w3.eth.block_number
-        from_block = max(0, current_block - 10000)
-        
-        # Get all events
-        mint_events = contract.events.Transfer.create_filter(
-            from_block=from_block,
-            argument_filters={'from': '0x0000000000000000000000000000000000000000'}
-        ).get_all_entries()
-        
-        listing_events = contract.events.NFTListed.create_filter(
-            from_block=from_block
-        ).get_all_entries()
-        
-        sale_events = contract.events.NFTSold.create_filter(
-            from_block=from_block
-        ).get_all_entries()
-        
-        # Format transactions
-        transactions = []
-        
-        for event in mint_events[-limit:]:
-            transactions.append({
-                'type': 'mint',
-                'token_id': event.args.tokenId,
-                'address': event.args.to,
-                'block': event.blockNumber,
-                'tx_hash': event.transactionHash.hex()
-            })
-        
-        for event in listing_events[-limit:]:
-            transactions.append({
-                'type': 'list',
-                'token_id': event.args.tokenId,
-                'seller': event.args.seller,
-                'price_eth': float(w3.from_wei(event.args.price, 'ether')),
-                'block': event.blockNumber,
-                'tx_hash': event.transactionHash.hex()
-            })
-        
-        for event in sale_events[-limit:]:
-            transactions.append({
-                'type': 'sale',
-                'token_id': event.args.tokenId,
-                'buyer': event.args.buyer,
-                'seller': event.args.seller,
-                'price_eth': float(w3.from_wei(event.args.price, 'ether')),
-                'block': event.blockNumber,
-                'tx_hash': event.transactionHash.hex()
-            })
-        
-        # Sort by block number (most recent first)
-        transactions.sort(key=lambda x: x['block'], reverse=True)
-        
-        return transactions[:limit]
-        
+
+        # Get all events through the incremental index
+        mint_events, listing_events, sale_events = _indexed_marketplace_events(current_block)
+
+        # Each indexed list is already in block order, so the newest
+        # entries are the tails. Merge the three descending tails lazily
+        # and format only the `limit` winners, instead of materializing
+        # and sorting 3*limit dicts per request.
+        merged = heapq.merge(
+            _descending_stream(mint_events[-limit:], _format_mint),
+            _descending_stream(listing_events[-limit:], _format_listing),
+            _descending_stream(sale_events[-limit:], _format_sale),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        return [formatter(event)
+                for _, formatter, event in islice(merged, limit)]
+
     except Exception as e:
         print(f"Error getting transactions: {e}")
         return []
 
+# is_connected() costs an eth_chainId RPC; load balancers probe /api/health
+# at a fixed rate per instance, so cache the answer for a second to bound
+# health-check traffic against the node to at most 1 QPS per process.
+_CONNECTED_TTL = 1.0
+_connected_cache = {'value': False, 'expires': 0.0}
+
+def _w3_connected():
+    now = time.monotonic()
+    if now >= _connected_cache['expires']:
+        _connected_cache['value'] = w3.is_connected() if w3 else False
+        _connected_cache['expires'] = now + _CONNECTED_TTL
+    return _connected_cache['value']
+
 # REST API Endpoints
 
 @app.route('/api/health', methods=['GET'])
@@ -232,7 +490,7 @@ def health():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'connected': w3.is_connected() if w3 else False,
+        'connected': _w3_connected(),
         'contract_loaded': contract is not None,
         'timestamp': datetime.now().isoformat()
     })
@@ -289,14 +547,44 @@ def handle_transactions_request(data):
         'transactions': get_recent_transactions(limit)
     })
 
-# Background task for real-time updates
+# Background tasks for real-time updates
+
+WS_URL = os.getenv('HARDHAT_WS_URL', HARDHAT_URL.replace('http', 'ws', 1))
+
+async def _subscribe_and_push():
+    """Push metrics when the contract actually emits events.
+
+    One eth_subscribe('logs', ...) over the node's WebSocket endpoint
+    replaces the periodic filter polling: the node pushes matching logs
+    as blocks are produced, each notification triggers one incremental
+    index refresh plus a broadcast, and idle periods cost zero RPC.
+    """
+    from web3 import AsyncWeb3
+    from web3.providers.websocket import WebsocketProviderV2
+
+    async_w3 = await AsyncWeb3.persistent_websocket(WebsocketProviderV2(WS_URL))
+    await async_w3.eth.subscribe('logs', {
+        'address': contract.address,
+        'topics': [list(_get_topic_dispatch())],
+    })
+    async for _ in async_w3.ws.process_subscriptions():
+        socketio.emit('metrics_update', _compute_marketplace_metrics())
+
+def background_event_subscription():
+    """Run the log subscription loop, falling back to timed polling."""
+    import asyncio
+    try:
+        asyncio.run(_subscribe_and_push())
+    except Exception as e:
+        print(f"⚠️  WebSocket subscription unavailable ({e}); polling instead")
+        background_metrics_update()
+
 def background_metrics_update():
     """Continuously send metrics updates to connected clients"""
-    import time
     while True:
-        time.sleep(5)  # Update every 5 seconds
+        socketio.sleep(5)  # Update every 5 seconds
         metrics = get_marketplace_metrics()
-        socketio.emit('metrics_update', metrics, broadcast=True)
+        socketio.emit('metrics_update', metrics)
 
 if __name__ == '__main__':
     print("\n" + "="*60)
@@ -309,8 +597,8 @@ if __name__ == '__main__':
     print(f"   API Docs: http://localhost:{os.getenv('PORT', 5001)}/api/health")
     print("\n" + "="*60 + "\n")
     
-    # Start background task
-    # socketio.start_background_task(background_metrics_update)
+    # Start background task (event-driven; falls back to polling)
+    socketio.start_background_task(background_event_subscription)
     
     # Run server
     socketio.run(
@@ -4,47 +4,12 @@ Gas Analysis Tool for NFT Marketplace
 Analyzes gas report and identifies optimization opportunities
 """
 
-import re
 import sys
+from operator import itemgetter
 from pathlib import Path
 from tabulate import tabulate
 
-def parse_gas_report(file_path):
-    """Parse gas report text file and extract metrics"""
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Extract method gas costs
-    methods = {}
-    
-    # Pattern: |  NFTMarketplace  ·  methodName  ·  min  ·  max  ·  avg  ·  calls  ·  usd  |
-    method_pattern = r'\|  NFTMarketplace\s+·\s+(\w+)\s+·\s+([\d-]+)\s+·\s+([\d-]+)\s+·\s+([\d-]+)\s+·\s+(\d+)\s+·'
-    
-    for match in re.finditer(method_pattern, content):
-        method_name = match.group(1)
-        min_gas = match.group(2)
-        max_gas = match.group(3)
-        avg_gas = match.group(4)
-        calls = match.group(5)
-        
-        # Skip if no data
-        if min_gas == '-':
-            min_gas = avg_gas
-            max_gas = avg_gas
-        
-        methods[method_name] = {
-            'min': int(min_gas),
-            'max': int(max_gas),
-            'avg': int(avg_gas),
-            'calls': int(calls)
-        }
-    
-    # Extract deployment cost
-    deployment_pattern = r'\|  NFTMarketplace\s+·\s+[\d-]+\s+·\s+[\d-]+\s+·\s+(\d+)\s+·'
-    deployment_match = re.search(deployment_pattern, content)
-    deployment_cost = int(deployment_match.group(1)) if deployment_match else 0
-    
-    return methods, deployment_cost
+from gas_report import parse as parse_gas_report
 
 def analyze_and_recommend(methods, deployment_cost):
     """Analyze gas usage and provide optimization recommendations"""
@@ -61,32 +26,37 @@ def analyze_and_recommend(methods, deployment_cost):
         print("   ⚠️  High deployment cost - consider splitting contracts or optimization")
     print()
     
+    # Single fused pass over the parsed methods: one (name, min, avg, max,
+    # calls, total) tuple list feeds the table, the top-3 report, the
+    # recommendations and the savings estimate, instead of re-walking the
+    # dict and re-reading its sub-dicts for every section.
+    entries = [(name, data['min'], data['avg'], data['max'], data['calls'],
+                data['avg'] * data['calls'])
+               for name, data in methods.items()]
+    entries.sort(key=itemgetter(2), reverse=True)
+
     # 2. Method Analysis
     print("⚡ METHOD GAS COSTS (sorted by average)")
-    sorted_methods = sorted(methods.items(), key=lambda x: x[1]['avg'], reverse=True)
-    
-    table_data = []
-    for method_name, data in sorted_methods:
-        table_data.append([
-            method_name,
-            f"{data['min']:,}",
-            f"{data['avg']:,}",
-            f"{data['max']:,}",
-            data['calls']
-        ])
-    
-    print(tabulate(table_data, 
+    table_data = [
+        [name, f"{min_gas:,}", f"{avg_gas:,}", f"{max_gas:,}", calls]
+        for name, min_gas, avg_gas, max_gas, calls, _ in entries
+    ]
+
+    print(tabulate(table_data,
                    headers=['Method', 'Min Gas', 'Avg Gas', 'Max Gas', 'Calls'],
                    tablefmt='grid'))
     print()
-    
+
     # 3. Top 3 Expensive Operations
-    print("🔥 TOP 3 MOST EXPENSIVE OPERATIONS")
-    for i, (method_name, data) in enumerate(sorted_methods[:3], 1):
-        print(f"\n   {i}. {method_name}")
-        print(f"      Average: {data['avg']:,} gas")
-        print(f"      Called: {data['calls']} times")
-        print(f"      Total Used: {data['avg'] * data['calls']:,} gas")
+    # Accumulate the report lines and emit them with one join/print per
+    # section instead of a print call per line.
+    top_lines = ["🔥 TOP 3 MOST EXPENSIVE OPERATIONS"]
+    for i, (name, _, avg_gas, _, calls, total) in enumerate(entries[:3], 1):
+        top_lines.append(f"\n   {i}. {name}\n"
+                         f"      Average: {avg_gas:,} gas\n"
+                         f"      Called: {calls} times\n"
+                         f"      Total Used: {total:,} gas")
+    print("\n".join(top_lines))
     print()
     
     # 4. Optimization Recommendations
@@ -95,35 +65,35 @@ def analyze_and_recommend(methods, deployment_cost):
     
     recommendations = []
     
-    # Analyze each method
-    for method_name, data in methods.items():
-        if method_name == 'mintNFT' and data['avg'] > 100000:
+    # Analyze each method (driven from the fused entries list)
+    for method_name, _, avg_gas, _, _, _ in entries:
+        if method_name == 'mintNFT' and avg_gas > 100000:
             recommendations.append({
                 'priority': 'HIGH',
                 'method': method_name,
-                'current': data['avg'],
+                'current': avg_gas,
                 'issue': 'High minting cost',
                 'solution': '1. Store tokenURI hash instead of full string\n'
                            '2. Use events for metadata (Index off-chain)\n'
                            '3. Batch mint multiple NFTs in one transaction'
             })
         
-        if method_name == 'listNFT' and data['avg'] > 85000:
+        if method_name == 'listNFT' and avg_gas > 85000:
             recommendations.append({
                 'priority': 'MEDIUM',
                 'method': method_name,
-                'current': data['avg'],
+                'current': avg_gas,
                 'issue': 'Listing operation expensive',
                 'solution': '1. Pack struct fields efficiently (use uint96 for price)\n'
                            '2. Avoid redundant storage writes\n'
                            '3. Use uint8 for boolean flags'
             })
         
-        if method_name == 'buyNFT' and data['avg'] > 85000:
+        if method_name == 'buyNFT' and avg_gas > 85000:
             recommendations.append({
                 'priority': 'HIGH',
                 'method': method_name,
-                'current': data['avg'],
+                'current': avg_gas,
                 'issue': 'Purchase flow has high gas',
                 'solution': '1. Use unchecked arithmetic where overflow impossible\n'
                            '2. Cache storage reads in memory\n'
@@ -147,18 +117,19 @@ def analyze_and_recommend(methods, deployment_cost):
     priority_order = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
     recommendations.sort(key=lambda x: priority_order[x['priority']])
     
-    for i, rec in enumerate(recommendations, 1):
-        print(f"   [{rec['priority']}] {rec['method']}")
-        print(f"   Current: {rec['current']:,} gas")
-        print(f"   Issue: {rec['issue']}")
-        print(f"   Solution:")
-        for line in rec['solution'].split('\n'):
-            print(f"      {line}")
-        print()
+    rec_lines = []
+    for rec in recommendations:
+        rec_lines.append(f"   [{rec['priority']}] {rec['method']}\n"
+                         f"   Current: {rec['current']:,} gas\n"
+                         f"   Issue: {rec['issue']}\n"
+                         f"   Solution:")
+        rec_lines.extend(f"      {line}" for line in rec['solution'].split('\n'))
+        rec_lines.append("")
+    print("\n".join(rec_lines))
     
     # 5. Estimated Savings
     print("📊 POTENTIAL SAVINGS")
-    total_current = sum(m['avg'] * m['calls'] for m in methods.values())
+    total_current = sum(entry[5] for entry in entries)
     estimated_savings = int(total_current * 0.15)  # Conservative 15% estimate
     
     print(f"   Current Total Gas (all test operations): {total_current:,}")
@@ -4,37 +4,21 @@ Gas Comparison Tool
 Compares baseline vs optimized gas reports
 """
 
-import re
 import sys
 from pathlib import Path
 from tabulate import tabulate
 
-def parse_gas_report(file_path):
-    """Parse gas report and extract metrics"""
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    methods = {}
-    method_pattern = r'\|  NFTMarketplace\s+·\s+(\w+)\s+·\s+([\d-]+)\s+·\s+([\d-]+)\s+·\s+([\d-]+)\s+·\s+(\d+)\s+·'
-    
-    for match in re.finditer(method_pattern, content):
-        method_name = match.group(1)
-        avg_gas = match.group(4)
-        
-        if avg_gas != '-':
-            methods[method_name] = int(avg_gas)
-    
-    deployment_pattern = r'\|  NFTMarketplace\s+·\s+[\d-]+\s+·\s+[\d-]+\s+·\s+(\d+)\s+·'
-    deployment_match = re.search(deployment_pattern, content)
-    deployment_cost = int(deployment_match.group(1)) if deployment_match else 0
-    
-    return methods, deployment_cost
+from gas_report import parse as parse_gas_report
 
 def compare_reports(baseline_file, optimized_file):
     """Compare two gas reports and show improvements"""
-    
-    baseline_methods, baseline_deploy = parse_gas_report(baseline_file)
-    optimized_methods, optimized_deploy = parse_gas_report(optimized_file)
+
+    baseline_all, baseline_deploy = parse_gas_report(baseline_file)
+    optimized_all, optimized_deploy = parse_gas_report(optimized_file)
+
+    # The comparison only looks at averages
+    baseline_methods = {name: data['avg'] for name, data in baseline_all.items()}
+    optimized_methods = {name: data['avg'] for name, data in optimized_all.items()}
     
     print("\n" + "="*90)
     print(" GAS OPTIMIZATION RESULTS ".center(90, "="))
@@ -58,34 +42,33 @@ def compare_reports(baseline_file, optimized_file):
     # Method comparison
     print("⚡ METHOD GAS COMPARISON")
     
-    table_data = []
-    total_baseline = 0
-    total_optimized = 0
-    
     all_methods = set(baseline_methods.keys()) | set(optimized_methods.keys())
-    
-    for method in sorted(all_methods):
-        baseline_gas = baseline_methods.get(method, 0)
-        optimized_gas = optimized_methods.get(method, 0)
-        
-        if baseline_gas > 0:
-            diff = baseline_gas - optimized_gas
-            pct = (diff / baseline_gas * 100) if baseline_gas > 0 else 0
-            
-            status = "✅" if pct > 0 else "⚠️" if pct < 0 else "➖"
-            
-            table_data.append([
-                method,
-                f"{baseline_gas:,}",
-                f"{optimized_gas:,}",
-                f"{diff:+,}",
-                f"{pct:+.2f}%",
-                status
-            ])
-            
-            total_baseline += baseline_gas
-            total_optimized += optimized_gas
-    
+
+    # Precompute the numeric rows once, then format them in a single
+    # comprehension — one list build instead of per-row append/format
+    # interleaving, and the same tuples feed the totals below.
+    pairs = [
+        (method, baseline_methods[method], optimized_methods.get(method, 0))
+        for method in sorted(all_methods)
+        if baseline_methods.get(method, 0) > 0
+    ]
+    rows = [
+        (method, baseline_gas, optimized_gas,
+         baseline_gas - optimized_gas,
+         (baseline_gas - optimized_gas) / baseline_gas * 100)
+        for method, baseline_gas, optimized_gas in pairs
+    ]
+
+    table_data = [
+        [method, f"{baseline_gas:,}", f"{optimized_gas:,}",
+         f"{diff:+,}", f"{pct:+.2f}%",
+         "✅" if pct > 0 else "⚠️" if pct < 0 else "➖"]
+        for method, baseline_gas, optimized_gas, diff, pct in rows
+    ]
+
+    total_baseline = sum(row[1] for row in rows)
+    total_optimized = sum(row[2] for row in rows)
+
     print(tabulate(table_data,
                    headers=['Method', 'Baseline', 'Optimized', 'Savings', 'Change %', 'Status'],
                    tablefmt='grid'))
@@ -120,15 +103,14 @@ def compare_reports(baseline_file, optimized_file):
     if deploy_pct > 10:
         achievements.append("📦 Deployment significantly optimized")
     
-    # Check specific methods
-    for method, baseline in baseline_methods.items():
-        if method in optimized_methods:
-            optimized = optimized_methods[method]
-            method_pct = ((baseline - optimized) / baseline * 100)
-            
-            if method == 'mintNFT' and method_pct > 15:
+    # Check specific methods — the per-method percentages were already
+    # computed in the comparison rows, so reuse them instead of walking
+    # the dicts again.
+    for method, _, optimized_gas, _, pct in rows:
+        if optimized_gas > 0:
+            if method == 'mintNFT' and pct > 15:
                 achievements.append("🎨 Minting highly optimized")
-            if method == 'buyNFT' and method_pct > 10:
+            if method == 'buyNFT' and pct > 10:
                 achievements.append("💰 Purchase flow optimized")
     
     for achievement in achievements:
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Shared gas-report parser
+Used by analyze-gas.py and compare-gas.py
+"""
+
+import os
+from functools import lru_cache
+
+# Rows of interest in a hardhat-gas-reporter table:
+#   |  NFTMarketplace  ·  methodName  ·  min  ·  max  ·  avg  ·  calls  ·  usd  |
+#   |  NFTMarketplace  ·  min  ·  max  ·  avg  ·  % of limit  ·  usd  |   (deployments)
+
+
+def parse(file_path):
+    """Parse a gas report file.
+
+    Returns:
+        tuple: ({method: {'min', 'max', 'avg', 'calls'}}, deployment_cost)
+
+    Results are memoized per (path, mtime, size), so iterative comparison
+    sessions that re-read an unchanged report skip the file scan.
+    """
+    path = str(file_path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return _parse(path)
+    return _parse_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _parse_cached(path, mtime_ns, size):
+    return _parse(path)
+
+
+def _parse(path):
+    methods = {}
+    deployment_cost = 0
+
+    # Stream the report line by line: the literal-substring prefilter
+    # rejects the vast majority of rows with one memchr scan, and the
+    # survivors are tokenized by a plain split on the column separator —
+    # no regex backtracking over the whole file, and peak memory is one
+    # line instead of the entire report. The 64 KiB buffer keeps the
+    # line iterator fed with few syscalls on large reports.
+    with open(path, 'r', buffering=1 << 16) as f:
+        for line in f:
+            if 'NFTMarketplace' not in line:
+                continue
+
+            parts = [p.strip(' |\n') for p in line.split('·')]
+            if len(parts) >= 6 and parts[1].isidentifier() and parts[5].isdigit():
+                # Method row
+                method_name = parts[1]
+                min_gas, max_gas, avg_gas, calls = parts[2], parts[3], parts[4], parts[5]
+
+                # Skip if no data
+                if not avg_gas.isdigit():
+                    continue
+                if min_gas == '-':
+                    min_gas = avg_gas
+                    max_gas = avg_gas
+
+                methods[method_name] = {
+                    'min': int(min_gas),
+                    'max': int(max_gas),
+                    'avg': int(avg_gas),
+                    'calls': int(calls)
+                }
+            elif not deployment_cost:
+                # Deployment row: same tokens, no method-name column, so
+                # the average sits in parts[3] and is all digits. The
+                # split already paid for the tokenization — no need to
+                # rescan the line with a regex.
+                if (len(parts) >= 4 and parts[0] == 'NFTMarketplace'
+                        and parts[3].isdigit()):
+                    deployment_cost = int(parts[3])
+
+    return methods, deployment_cost
@@ -4,13 +4,15 @@ Performance Monitoring Service
 Tracks system, API, and blockchain metrics
 """
 
-import time
+import asyncio
+import logging
 import psutil
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-from prometheus_client import Counter, Histogram, Gauge, generate_latest
+from prometheus_client import Counter, Histogram, Gauge, generate_latest, start_http_server
 from web3 import Web3
 
 # Prometheus metrics
@@ -23,6 +25,10 @@ blockchain_block = Gauge('blockchain_current_block', 'Current blockchain block n
 # Web3 connection
 w3 = Web3(Web3.HTTPProvider('http://127.0.0.1:8545'))
 
+# Lazy %-style args: the format cost is only paid when a handler is
+# enabled, so a supervisor discarding output doesn't tax the loop.
+logger = logging.getLogger('monitor')
+
 class PerformanceMonitor:
     def __init__(self):
         self.metrics = {
@@ -31,16 +37,18 @@ class PerformanceMonitor:
             'api': {},
             'timestamp': None
         }
-        
+        # Prime the CPU counter: the first interval=None call returns 0.0,
+        # later calls return the delta since the previous one, so the
+        # collection loop's own cadence provides the sampling window.
+        psutil.cpu_percent(interval=None)
+        self._collector = ThreadPoolExecutor(max_workers=2)
+
     def collect_system_metrics(self):
         """Collect system performance metrics"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
-        
-        system_cpu.set(cpu_percent)
-        system_memory.set(memory.percent)
-        
+
         self.metrics['system'] = {
             'cpu_percent': cpu_percent,
             'memory_percent': memory.percent,
@@ -59,11 +67,12 @@ class PerformanceMonitor:
             return {'error': 'Not connected to blockchain'}
         
         try:
-            block_number = w3.eth.block_number
+            # One round-trip: the latest block already carries its own
+            # number, so a separate eth_blockNumber call would only add
+            # a second HTTP request and a chance of racing a new block.
             block = w3.eth.get_block('latest')
-            
-            blockchain_block.set(block_number)
-            
+            block_number = block.number
+
             self.metrics['blockchain'] = {
                 'current_block': block_number,
                 'gas_limit': block.gasLimit,
@@ -77,20 +86,71 @@ class PerformanceMonitor:
             return {'error': str(e)}
     
     def collect_all_metrics(self):
-        """Collect all metrics"""
-        self.collect_system_metrics()
-        self.collect_blockchain_metrics()
+        """Collect all metrics.
+
+        System sampling and the blockchain JSON-RPC call run on separate
+        workers so the network round-trip overlaps with the local reads.
+        """
+        system_future = self._collector.submit(self.collect_system_metrics)
+        blockchain_future = self._collector.submit(self.collect_blockchain_metrics)
+        system_future.result()
+        blockchain_future.result()
+        self._publish_gauges()
         self.metrics['timestamp'] = datetime.now().isoformat()
-        
+
         return self.metrics
+
+    def _publish_gauges(self):
+        """Push the collected snapshot into the Prometheus gauges.
+
+        The gauge writes happen back-to-back after collection finishes,
+        so a concurrent scrape contends with three quick sets instead of
+        lock acquisitions interleaved with sampling and RPC latency.
+        """
+        system = self.metrics['system']
+        if system:
+            system_cpu.set(system['cpu_percent'])
+            system_memory.set(system['memory_percent'])
+
+        blockchain = self.metrics['blockchain']
+        if 'current_block' in blockchain:
+            blockchain_block.set(blockchain['current_block'])
     
     def get_prometheus_metrics(self):
         """Generate Prometheus metrics"""
         return generate_latest()
 
+async def collect_periodically(monitor, interval=5):
+    """Collect metrics on a fixed cadence without blocking the event loop.
+
+    Collection runs in the default executor, so the loop stays free for
+    additional collectors (contract events, mempool depth) to join later
+    without each one needing its own thread and sleep.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        metrics = await loop.run_in_executor(None, monitor.collect_all_metrics)
+
+        logger.info("Metrics Update")
+        logger.info("  CPU: %.1f%%", metrics['system']['cpu_percent'])
+        logger.info("  Memory: %.1f%%", metrics['system']['memory_percent'])
+
+        if 'error' not in metrics['blockchain']:
+            logger.info("  Block: %d", metrics['blockchain']['current_block'])
+            logger.info("  Gas Usage: %.1f%%",
+                        metrics['blockchain']['gas_usage_percent'])
+        else:
+            logger.warning("  Blockchain: %s", metrics['blockchain']['error'])
+
+        await asyncio.sleep(interval)
+
 def main():
+    logging.basicConfig(level=logging.INFO,
+                        format='[%(asctime)s] %(message)s',
+                        datefmt='%H:%M:%S')
+
     monitor = PerformanceMonitor()
-    
+
     print("="*60)
     print(" Performance Monitoring Service ".center(60, "="))
     print("="*60)
@@ -98,24 +158,13 @@ def main():
     print(f"   Hardhat URL: http://127.0.0.1:8545")
     print(f"   Metrics endpoint: http://localhost:9090/metrics")
     print("\n" + "="*60 + "\n")
-    
+
+    # Prometheus pulls the latest in-memory snapshot on demand; scrapes
+    # never trigger extra RPCs against the node.
+    start_http_server(9090)
+
     try:
-        while True:
-            metrics = monitor.collect_all_metrics()
-            
-            # Print metrics
-            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Metrics Update")
-            print(f"  CPU: {metrics['system']['cpu_percent']:.1f}%")
-            print(f"  Memory: {metrics['system']['memory_percent']:.1f}%")
-            
-            if 'error' not in metrics['blockchain']:
-                print(f"  Block: {metrics['blockchain']['current_block']}")
-                print(f"  Gas Usage: {metrics['blockchain']['gas_usage_percent']:.1f}%")
-            else:
-                print(f"  Blockchain: {metrics['blockchain']['error']}")
-            
-            time.sleep(5)  # Update every 5 seconds
-            
+        asyncio.run(collect_periodically(monitor))
     except KeyboardInterrupt:
         print("\n\n✅ Monitoring stopped\n")
 